@@ -22,6 +22,13 @@ class ValidationConfig:
     MAX_CSV_FILE_SIZE = int(os.getenv("MAX_CSV_FILE_SIZE", str(1 * 1024 * 1024 * 1024)))  # 1GB default
     STREAMING_THRESHOLD = int(os.getenv("STREAMING_THRESHOLD", str(100 * 1024 * 1024)))  # 100MB default
     
+    # Marketplaces whose rule engines are compiled when a worker process starts
+    PRELOAD_MARKETPLACES: Set[str] = {
+        marketplace.strip()
+        for marketplace in os.getenv("PRELOAD_MARKETPLACES", "MERCADO_LIVRE").split(",")
+        if marketplace.strip()
+    }
+    
     @classmethod
     def get_allowed_rulesets(cls) -> Set[str]:
         """
@@ -87,6 +94,10 @@ class QueueConfig:
     DEFAULT_JOB_TIME_LIMIT = int(os.getenv("DEFAULT_JOB_TIME_LIMIT", "300"))
     DEFAULT_JOB_SOFT_TIME_LIMIT = int(os.getenv("DEFAULT_JOB_SOFT_TIME_LIMIT", "270"))
     
+    # Worker tuning for long-running validation tasks
+    WORKER_PREFETCH_MULTIPLIER = int(os.getenv("WORKER_PREFETCH_MULTIPLIER", "1"))
+    WORKER_MAX_TASKS_PER_CHILD = int(os.getenv("WORKER_MAX_TASKS_PER_CHILD", "50"))
+    
     @classmethod
     def get_task_mappings(cls) -> Dict[str, str]:
         """
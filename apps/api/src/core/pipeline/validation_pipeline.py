@@ -54,26 +54,36 @@ class ValidationPipeline:
         validation_items: List[ValidationItem] = []
         fixed_rows: List[Dict[str, Any]] = []
         
-        for idx, row in df.iterrows():
-            row_dict = row.to_dict()
-            row_number = idx + 1  # 1-indexed for user display
-            
-            if auto_fix:
+        # Rows that pass every rule column-wise produce no validation items
+        # and need no fixes, so only the remaining rows go through the
+        # row-by-row rule engine
+        clean_rows = self.rule_engine_service.screen_clean_rows(df, marketplace_str)
+        
+        if auto_fix:
+            # The corrected output needs every row; clean rows pass through as-is
+            for idx, row_dict, is_clean in zip(df.index, df.to_dict("records"), clean_rows):
+                if is_clean:
+                    fixed_rows.append(row_dict)
+                    continue
+                
+                row_number = idx + 1  # 1-indexed for user display
                 fixed_row, items = self.rule_engine_service.validate_and_fix_row(
                     row_dict,
                     marketplace_str,
                     row_number
                 )
                 fixed_rows.append(fixed_row)
-            else:
+                validation_items.extend(items)
+        else:
+            dirty = ~clean_rows
+            for idx, row_dict in zip(df.index[dirty], df[dirty].to_dict("records")):
+                row_number = idx + 1  # 1-indexed for user display
                 items = self.rule_engine_service.validate_row(
                     row_dict,
                     marketplace_str,
                     row_number
                 )
-                fixed_rows.append(row_dict)
-            
-            validation_items.extend(items)
+                validation_items.extend(items)
         
         # Calculate summary statistics
         total_rows = len(df)
@@ -27,6 +27,8 @@ class ValidationRegistry:
     - Supports metadata for introspection
     """
     
+    __slots__ = ("_validators", "_meta", "_default")
+    
     def __init__(self) -> None:
         self._validators: Dict[Any, ValidatorFn] = {}
         self._meta: Dict[Any, ValidatorSpec] = {}
@@ -64,7 +66,9 @@ class ValidationRegistry:
         Validate a value using the registered validator for the key.
         Falls back to default validator if key not found.
         """
-        fn = self._validators.get(key, self._default)
+        fn = self._validators.get(key)
+        if fn is None:
+            return self._default(value)
         return fn(value)
     
     def describe(self, key: Any) -> Optional[ValidatorSpec]:
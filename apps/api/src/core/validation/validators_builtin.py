@@ -5,8 +5,13 @@ These cover the common types used across all marketplaces.
 
 from __future__ import annotations
 from datetime import datetime, date
-from typing import Any
-from .registry import validation_registry, ValidatorSpec
+from typing import Any, Optional
+from .registry import ValidationRegistry, validation_registry, ValidatorSpec
+
+
+def _is_string(v: Any) -> bool:
+    """Check if value is a string."""
+    return isinstance(v, str)
 
 
 def _is_int_without_bool(v: Any) -> bool:
@@ -19,17 +24,54 @@ def _is_float_like_without_bool(v: Any) -> bool:
     return isinstance(v, (int, float)) and not isinstance(v, bool)
 
 
-def register_builtin_validators(DataType: Any) -> None:
+def _is_bool(v: Any) -> bool:
+    """Check if value is a boolean."""
+    return isinstance(v, bool)
+
+
+def _is_date_like(v: Any) -> bool:
+    """Check if value is a string, datetime or date."""
+    return isinstance(v, (str, datetime, date))
+
+
+def _is_datetime_like(v: Any) -> bool:
+    """Check if value is a string or datetime."""
+    return isinstance(v, (str, datetime))
+
+
+def _is_array(v: Any) -> bool:
+    """Check if value is a list or tuple."""
+    return isinstance(v, (list, tuple))
+
+
+def _is_object(v: Any) -> bool:
+    """Check if value is a dict."""
+    return isinstance(v, dict)
+
+
+def _accept_any(v: Any) -> bool:
+    """Accept every value."""
+    return True
+
+
+def register_builtin_validators(
+    DataType: Any,
+    registry: Optional[ValidationRegistry] = None
+) -> None:
     """
     Register standard validators for built-in DataTypes.
     
     Args:
         DataType: The DataType enum to use as keys
+        registry: Registry to populate (defaults to the global registry)
     """
+    if registry is None:
+        registry = validation_registry
+    
     # String validation
-    validation_registry.register(
+    registry.register(
         DataType.STRING,
-        lambda v: isinstance(v, str),
+        _is_string,
         meta=ValidatorSpec(
             name="string",
             description="Accepts Python str"
@@ -37,7 +79,7 @@ def register_builtin_validators(DataType: Any) -> None:
     )
     
     # Integer validation (excludes bool)
-    validation_registry.register(
+    registry.register(
         DataType.INTEGER,
         _is_int_without_bool,
         meta=ValidatorSpec(
@@ -47,7 +89,7 @@ def register_builtin_validators(DataType: Any) -> None:
     )
     
     # Float validation (accepts int or float, excludes bool)
-    validation_registry.register(
+    registry.register(
         DataType.FLOAT,
         _is_float_like_without_bool,
         meta=ValidatorSpec(
@@ -57,9 +99,9 @@ def register_builtin_validators(DataType: Any) -> None:
     )
     
     # Boolean validation
-    validation_registry.register(
+    registry.register(
         DataType.BOOLEAN,
-        lambda v: isinstance(v, bool),
+        _is_bool,
         meta=ValidatorSpec(
             name="boolean",
             description="Accepts bool"
@@ -67,9 +109,9 @@ def register_builtin_validators(DataType: Any) -> None:
     )
     
     # Date validation (accepts string or datetime/date objects)
-    validation_registry.register(
+    registry.register(
         DataType.DATE,
-        lambda v: isinstance(v, (str, datetime, date)),
+        _is_date_like,
         meta=ValidatorSpec(
             name="date",
             description="Accepts str, datetime, or date"
@@ -77,9 +119,9 @@ def register_builtin_validators(DataType: Any) -> None:
     )
     
     # DateTime validation
-    validation_registry.register(
+    registry.register(
         DataType.DATETIME,
-        lambda v: isinstance(v, (str, datetime)),
+        _is_datetime_like,
         meta=ValidatorSpec(
             name="datetime",
             description="Accepts str or datetime"
@@ -87,9 +129,9 @@ def register_builtin_validators(DataType: Any) -> None:
     )
     
     # Array validation
-    validation_registry.register(
+    registry.register(
         DataType.ARRAY,
-        lambda v: isinstance(v, (list, tuple)),
+        _is_array,
         meta=ValidatorSpec(
             name="array",
             description="Accepts list or tuple"
@@ -97,9 +139,9 @@ def register_builtin_validators(DataType: Any) -> None:
     )
     
     # Object validation
-    validation_registry.register(
+    registry.register(
         DataType.OBJECT,
-        lambda v: isinstance(v, dict),
+        _is_object,
         meta=ValidatorSpec(
             name="object",
             description="Accepts dict"
@@ -107,4 +149,4 @@ def register_builtin_validators(DataType: Any) -> None:
     )
     
     # Set permissive default (maintains current behavior)
-    validation_registry.set_default(lambda v: True)
+    registry.set_default(_accept_any)
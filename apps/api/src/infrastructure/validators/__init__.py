@@ -6,8 +6,10 @@ various services to work with the core validation interfaces.
 """
 
 from .rule_engine_validator import RuleEngineValidator, MultiStrategyValidator
+from .frame_screen import screen_clean_rows
 
 __all__ = [
     'RuleEngineValidator',
     'MultiStrategyValidator',
+    'screen_clean_rows',
 ]
\ No newline at end of file
@@ -0,0 +1,122 @@
+"""
+Vectorized pre-screening of DataFrames against YAML rule engine rules.
+
+The rule engine evaluates rules one row at a time. Most rows in a typical
+upload are valid, so evaluating every rule as a column operation first lets
+the pipeline skip the per-row interpreter for rows that certainly pass.
+
+The screen is conservative: a row is only marked clean when every rule is
+guaranteed to PASS or SKIP for it. Anything uncertain (missing values,
+unparseable numbers, conditions that cannot be evaluated column-wise,
+unknown check types) is left for the row-by-row engine, so results are
+identical to running the engine on every row.
+"""
+
+from src.core.logging_config import get_logger
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.libs.rule_engine.engine import RuleEngine
+
+logger = get_logger(__name__)
+
+
+def screen_clean_rows(engine: RuleEngine, df: pd.DataFrame) -> np.ndarray:
+    """
+    Find rows for which no rule can report a failure.
+
+    Args:
+        engine: Rule engine with a loaded ruleset
+        df: DataFrame to screen; cells are expected to be scalars
+
+    Returns:
+        Boolean array aligned with ``df`` rows, True where the row is clean
+    """
+    clean = np.ones(len(df), dtype=bool)
+
+    for rule in engine.rules:
+        try:
+            ok = _rule_ok_mask(rule, df, engine.mappings)
+        except Exception as e:
+            # Leave the rule to the row-by-row engine, which reports errors
+            logger.debug(f"Cannot screen rule {rule.get('id', 'unknown')} column-wise: {e}")
+            ok = None
+
+        if ok is None:
+            return np.zeros(len(df), dtype=bool)
+
+        clean &= ok
+        if not clean.any():
+            break
+
+    return clean
+
+
+def _rule_ok_mask(
+    rule: Dict[str, Any],
+    df: pd.DataFrame,
+    mappings: Dict[str, Any]
+) -> Optional[np.ndarray]:
+    """Rows where ``rule`` certainly passes or is skipped, or None if unknown."""
+    # Rules without an id make the engine report an ERROR
+    if "id" not in rule:
+        return None
+
+    passed = _check_pass_mask(rule.get("check", {}), df, mappings)
+    if passed is None:
+        return None
+
+    if "when" in rule:
+        passed = passed | _when_false_mask(rule["when"], df)
+
+    return passed
+
+
+def _check_pass_mask(
+    check: Dict[str, Any],
+    df: pd.DataFrame,
+    mappings: Dict[str, Any]
+) -> Optional[np.ndarray]:
+    """Rows where the rule check certainly passes, or None for unknown checks."""
+    check_type = check.get("type")
+    if check_type not in ("required", "numeric_min", "in_set"):
+        return None
+
+    field = check["field"]
+    if field not in df.columns:
+        return np.zeros(len(df), dtype=bool)
+    column = df[field]
+
+    if check_type == "required":
+        # None/NaN are left to the row engine, which treats them differently
+        return (column.notna() & (column != "")).to_numpy(dtype=bool)
+
+    if check_type == "numeric_min":
+        min_val = check.get("value", check.get("min"))
+        if min_val is None:
+            return np.zeros(len(df), dtype=bool)
+        if column.dtype == bool:
+            numeric = column.astype(float)
+        else:
+            numeric = pd.to_numeric(column, errors="coerce")
+        return (numeric >= min_val).fillna(False).to_numpy(dtype=bool)
+
+    # in_set
+    valid_set = check.get("values", [])
+    if "mapping" in check:
+        valid_set = mappings.get(check["mapping"], [])
+    return (column.notna() & column.isin(list(valid_set))).to_numpy(dtype=bool)
+
+
+def _when_false_mask(condition: str, df: pd.DataFrame) -> np.ndarray:
+    """Rows where a ``when`` condition is certainly false (rule skipped)."""
+    if "==" in condition or "!=" in condition:
+        # Comparisons stringify values; leave them to the row engine
+        return np.zeros(len(df), dtype=bool)
+
+    field = condition.strip()
+    if field not in df.columns:
+        return np.ones(len(df), dtype=bool)
+    return (df[field] == "").to_numpy(dtype=bool)
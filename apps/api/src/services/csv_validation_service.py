@@ -57,7 +57,41 @@ class CSVValidationService:
         try:
             # Parse CSV
             df = pd.read_csv(io.StringIO(csv_content))
-            
+        except Exception as e:
+            logger.error(f"Error validating CSV: {e}")
+            return self._failure_result(e), None
+        
+        return self.validate_dataframe(
+            df=df,
+            marketplace=marketplace,
+            category=category,
+            auto_fix=auto_fix
+        )
+    
+    def validate_dataframe(
+        self,
+        df: pd.DataFrame,
+        marketplace: str = "mercado_livre",
+        category: str = "general",
+        auto_fix: bool = False
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """
+        Validate an already parsed DataFrame and return results.
+        
+        Rules are screened column-wise first, so only rows that may fail
+        are evaluated row by row.
+        
+        Args:
+            df: Parsed CSV data
+            marketplace: Target marketplace
+            category: Product category
+            auto_fix: Whether to apply auto-corrections
+        
+        Returns:
+            Tuple of (validation_result dict, corrected_csv string or None)
+        """
+        
+        try:
             if df.empty:
                 return {
                     "total_rows": 0,
@@ -133,13 +167,17 @@ class CSVValidationService:
             
         except Exception as e:
             logger.error(f"Error validating CSV: {e}")
-            return {
-                "total_rows": 0,
-                "valid_rows": 0,
-                "error_rows": 0,
-                "errors": [{"message": str(e), "severity": "ERROR"}],
-                "warnings": []
-            }, None
+            return self._failure_result(e), None
+    
+    def _failure_result(self, error: Exception) -> Dict[str, Any]:
+        """Build the validation result reported when validation itself fails."""
+        return {
+            "total_rows": 0,
+            "valid_rows": 0,
+            "error_rows": 0,
+            "errors": [{"message": str(error), "severity": "ERROR"}],
+            "warnings": []
+        }
     
     def calculate_metrics(
         self,
@@ -3,18 +3,27 @@ Policy Loader Service - Loads and caches validation policies from YAML files.
 """
 
 import yaml
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime, timezone
-from functools import lru_cache
 from src.core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# libyaml-backed loader when available, pure-Python SafeLoader otherwise
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 class PolicyLoader:
     """Loads marketplace policies from YAML files."""
     
+    # Maximum number of parsed policies kept in memory
+    CACHE_MAX_ENTRIES = 100
+    
     def __init__(self, policies_dir: Optional[Path] = None):
         """Initialize with policies directory."""
         if policies_dir is None:
@@ -23,10 +32,13 @@ class PolicyLoader:
         else:
             self.policies_dir = Path(policies_dir)
         
-        self._cache: Dict[str, Dict[str, Any]] = {}
+        # LRU of policy file path -> (mtime_ns, size, policy); entries are
+        # reparsed when the file changes on disk
+        self._cache: "OrderedDict[str, Tuple[int, int, Dict[str, Any]]]" = OrderedDict()
+        # (marketplace, category) -> policy file path, joined once
+        self._policy_paths: Dict[Tuple[str, str], Path] = {}
         logger.info(f"PolicyLoader initialized with directory: {self.policies_dir}")
     
-    @lru_cache(maxsize=128)
     def get_policy(
         self, 
         marketplace: str, 
@@ -44,25 +56,31 @@ class PolicyLoader:
         Returns:
             Policy dictionary with rules and metadata
         """
-        cache_key = f"{marketplace}:{category}:{version or 'latest'}"
-        
-        # Check cache first
-        if cache_key in self._cache:
-            logger.debug(f"Policy cache hit: {cache_key}")
-            return self._cache[cache_key]
-        
         # Build file path
-        policy_file = self.policies_dir / marketplace / "categories" / f"{category}.yml"
+        policy_file = self._policy_path(marketplace, category)
         
-        if not policy_file.exists():
+        try:
+            stat = policy_file.stat()
+        except OSError:
             logger.warning(f"Policy file not found: {policy_file}")
             # Return minimal default policy
             return self._get_default_policy(marketplace, category)
         
+        # Check cache first
+        cache_key = str(policy_file)
+        cached = self._cache.get(cache_key)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            logger.debug(f"Policy cache hit: {cache_key}")
+            self._cache.move_to_end(cache_key)
+            policy = cached[2]
+            if version and policy.get("version") != version:
+                logger.warning(f"Version mismatch: requested {version}, found {policy.get('version')}")
+            return policy
+        
         try:
             # Load YAML
             with open(policy_file) as f:
-                policy = yaml.safe_load(f)
+                policy = yaml.load(f, Loader=_YamlLoader)
             
             # Convert datetime objects to strings for consistency
             if isinstance(policy.get("effective_date"), datetime):
@@ -76,8 +94,11 @@ class PolicyLoader:
             if version and policy.get("version") != version:
                 logger.warning(f"Version mismatch: requested {version}, found {policy.get('version')}")
             
-            # Cache the policy
-            self._cache[cache_key] = policy
+            # Cache the policy, evicting the least recently used ones
+            self._cache[cache_key] = (stat.st_mtime_ns, stat.st_size, policy)
+            self._cache.move_to_end(cache_key)
+            while len(self._cache) > self.CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
             logger.info(f"Loaded policy: {marketplace}/{category} v{policy.get('version')}")
             
             return policy
@@ -89,6 +110,14 @@ class PolicyLoader:
             logger.error(f"Failed to load policy: {e}")
             return self._get_default_policy(marketplace, category)
     
+    def _policy_path(self, marketplace: str, category: str) -> Path:
+        """Return the policy file path for a marketplace/category, caching the join."""
+        key = (marketplace, category)
+        path = self._policy_paths.get(key)
+        if path is None:
+            path = self._policy_paths[key] = self.policies_dir / marketplace / "categories" / f"{category}.yml"
+        return path
+    
     def _get_default_policy(self, marketplace: str, category: str) -> Dict[str, Any]:
         """
         Return a minimal default policy when specific one is not found.
@@ -165,7 +194,6 @@ class PolicyLoader:
     def reload_policies(self):
         """Clear cache to force reload of policies."""
         self._cache.clear()
-        self.get_policy.cache_clear()
         logger.info("Policy cache cleared")
     
     def validate_policy_structure(self, policy: Dict[str, Any]) -> tuple[bool, list[str]]:
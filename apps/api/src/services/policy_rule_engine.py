@@ -3,6 +3,7 @@ Policy-based Rule Engine - Validates data using YAML policies.
 """
 
 import re
+from dataclasses import dataclass
 from typing import Dict, List, Any, Optional, Tuple
 from decimal import Decimal
 from src.core.logging_config import get_logger
@@ -11,15 +12,15 @@ from .policy_loader import PolicyLoader
 logger = get_logger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
 class ValidationError:
     """Represents a validation error."""
     
-    def __init__(self, field: str, code: str, message: str, value: Any = None, severity: str = "ERROR"):
-        self.field = field
-        self.code = code
-        self.message = message
-        self.value = value
-        self.severity = severity
+    field: str
+    code: str
+    message: str
+    value: Any = None
+    severity: str = "ERROR"
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -65,18 +66,22 @@ class PolicyRuleEngine:
         
         errors = []
         corrections = []
+        # Bound once for the per-field loop below
+        extend_errors = errors.extend
+        extend_corrections = corrections.extend
+        validate_field = self._validate_field
+        get_value = row.get
         
         # Validate standard fields
         for field_name, field_rules in rules.items():
             if not isinstance(field_rules, dict):
                 continue
             
-            value = row.get(field_name)
-            field_errors, field_corrections = self._validate_field(
-                field_name, value, field_rules, error_codes, row_number
+            field_errors, field_corrections = validate_field(
+                field_name, get_value(field_name), field_rules, error_codes, row_number
             )
-            errors.extend(field_errors)
-            corrections.extend(field_corrections)
+            extend_errors(field_errors)
+            extend_corrections(field_corrections)
         
         # Validate custom attributes
         for attr_name, attr_rules in custom_attributes.items():
@@ -100,11 +105,8 @@ class PolicyRuleEngine:
                 )
                 errors.extend(attr_errors)
         
-        # Check for warnings (non-blocking)
-        warnings = self._check_warnings(row, policy)
-        for warning in warnings:
-            warning.severity = "WARNING"
-        errors.extend(warnings)
+        # Check for warnings (non-blocking, built with WARNING severity)
+        errors.extend(self._check_warnings(row, policy))
         
         # Determine if row is valid (only ERROR severity blocks)
         is_valid = not any(e.severity == "ERROR" for e in errors)
@@ -122,10 +124,11 @@ class PolicyRuleEngine:
         """Validate a single field against its rules."""
         errors = []
         corrections = []
+        append_error = errors.append
         
         # Check required
         if rules.get("required") and not value:
-            errors.append(ValidationError(
+            append_error(ValidationError(
                 field=field_name,
                 code=f"{field_name.upper()}_REQUIRED",
                 message=error_codes.get(
@@ -156,7 +159,7 @@ class PolicyRuleEngine:
             
             # Length validation
             if "min_length" in rules and len(value) < rules["min_length"]:
-                errors.append(ValidationError(
+                append_error(ValidationError(
                     field=field_name,
                     code=f"{field_name.upper()}_TOO_SHORT",
                     message=f"{field_name} must be at least {rules['min_length']} characters",
@@ -164,7 +167,7 @@ class PolicyRuleEngine:
                 ))
             
             if "max_length" in rules and len(value) > rules["max_length"]:
-                errors.append(ValidationError(
+                append_error(ValidationError(
                     field=field_name,
                     code=f"{field_name.upper()}_TOO_LONG",
                     message=f"{field_name} cannot exceed {rules['max_length']} characters",
@@ -175,7 +178,7 @@ class PolicyRuleEngine:
             if "forbidden_chars" in rules:
                 for char in rules["forbidden_chars"]:
                     if char in value:
-                        errors.append(ValidationError(
+                        append_error(ValidationError(
                             field=field_name,
                             code=f"{field_name.upper()}_FORBIDDEN_CHARS",
                             message=f"{field_name} contains forbidden character: {char}",
@@ -186,7 +189,7 @@ class PolicyRuleEngine:
             # Pattern validation
             if "pattern" in rules:
                 if not re.match(rules["pattern"], value):
-                    errors.append(ValidationError(
+                    append_error(ValidationError(
                         field=field_name,
                         code=f"{field_name.upper()}_INVALID_FORMAT",
                         message=f"{field_name} has invalid format",
@@ -204,7 +207,7 @@ class PolicyRuleEngine:
                 numeric_value = float(value) if field_name == "price" else int(float(value))
                 
                 if "min_value" in rules and numeric_value < rules["min_value"]:
-                    errors.append(ValidationError(
+                    append_error(ValidationError(
                         field=field_name,
                         code=f"{field_name.upper()}_TOO_LOW",
                         message=f"{field_name} must be at least {rules['min_value']}",
@@ -212,7 +215,7 @@ class PolicyRuleEngine:
                     ))
                 
                 if "max_value" in rules and numeric_value > rules["max_value"]:
-                    errors.append(ValidationError(
+                    append_error(ValidationError(
                         field=field_name,
                         code=f"{field_name.upper()}_TOO_HIGH",
                         message=f"{field_name} cannot exceed {rules['max_value']}",
@@ -223,7 +226,7 @@ class PolicyRuleEngine:
                 if field_name == "price" and "decimal_places" in rules:
                     decimal_str = str(numeric_value).split(".")
                     if len(decimal_str) > 1 and len(decimal_str[1]) > rules["decimal_places"]:
-                        errors.append(ValidationError(
+                        append_error(ValidationError(
                             field=field_name,
                             code="PRICE_DECIMAL_PLACES",
                             message=f"Price cannot have more than {rules['decimal_places']} decimal places",
@@ -231,7 +234,7 @@ class PolicyRuleEngine:
                         ))
         except (ValueError, TypeError):
             if field_name in ["price", "stock"]:
-                errors.append(ValidationError(
+                append_error(ValidationError(
                     field=field_name,
                     code=f"{field_name.upper()}_NOT_NUMERIC",
                     message=f"{field_name} must be numeric",
@@ -242,19 +245,26 @@ class PolicyRuleEngine:
         if "enum_values" in rules:
             # Case-insensitive comparison if specified
             enum_values = rules["enum_values"]
-            if not rules.get("case_sensitive", True):
+            case_sensitive = rules.get("case_sensitive", True)
+            # Membership set built on first use and kept with the rule, so
+            # a cached policy pays for it once per field
+            enum_set = rules.get("_enum_set")
+            if enum_set is None:
+                enum_set = rules["_enum_set"] = frozenset(
+                    enum_values if case_sensitive else (v.lower() for v in enum_values)
+                )
+            if not case_sensitive:
                 value_lower = str(value).lower()
-                enum_values_lower = [v.lower() for v in enum_values]
-                if value_lower not in enum_values_lower:
-                    errors.append(ValidationError(
+                if value_lower not in enum_set:
+                    append_error(ValidationError(
                         field=field_name,
                         code=f"{field_name.upper()}_INVALID_VALUE",
                         message=f"{field_name} must be one of: {', '.join(rules['enum_values'])}",
                         value=value
                     ))
             else:
-                if value not in enum_values:
-                    errors.append(ValidationError(
+                if value not in enum_set:
+                    append_error(ValidationError(
                         field=field_name,
                         code=f"{field_name.upper()}_INVALID_VALUE",
                         message=f"{field_name} must be one of: {', '.join(enum_values)}",
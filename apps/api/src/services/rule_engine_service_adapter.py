@@ -8,6 +8,9 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 
+import numpy as np
+import pandas as pd
+
 from .rule_engine_service_refactored import (
     RuleEngineServiceRefactored,
     RuleEngineServiceConfig
@@ -148,6 +151,19 @@ class RuleEngineService:
             row, marketplace, row_number, auto_fix
         )
     
+    def screen_clean_rows(self, df: pd.DataFrame, marketplace: str) -> np.ndarray:
+        """
+        Find rows that pass every rule, evaluated column-wise.
+        
+        Args:
+            df: DataFrame to screen
+            marketplace: Target marketplace
+            
+        Returns:
+            Boolean array, True for rows that need no row-level validation
+        """
+        return self._service.screen_clean_rows(df, marketplace)
+    
     def _convert_result_to_validation_item(self, result, row_number, original_row):
         """
         Legacy method kept for compatibility.
@@ -8,12 +8,16 @@ from src.core.logging_config import get_logger
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 
+import numpy as np
+import pandas as pd
+
 from src.infrastructure.factories.rule_engine_factory import (
     RuleEngineFactory,
     RuleEngineFactoryConfig
 )
 from src.infrastructure.loaders.rule_loader import RuleLoader, RuleLoaderConfig
 from src.infrastructure.mappers.result_mapper import ResultMapper
+from src.infrastructure.validators.frame_screen import screen_clean_rows
 from src.schemas.validate import ValidationItem
 
 logger = get_logger(__name__)
@@ -129,6 +133,20 @@ class RuleEngineServiceRefactored:
         
         return fixed_row, validation_items
     
+    def screen_clean_rows(self, df: pd.DataFrame, marketplace: str) -> np.ndarray:
+        """
+        Find rows that pass every rule, evaluated column-wise.
+        
+        Args:
+            df: DataFrame to screen
+            marketplace: Target marketplace
+            
+        Returns:
+            Boolean array, True for rows that need no row-level validation
+        """
+        engine = self.engine_factory.get_engine(marketplace)
+        return screen_clean_rows(engine, df)
+    
     def clear_cache(self):
         """Clear all caches in the service."""
         self.engine_factory.clear_cache()
@@ -5,16 +5,79 @@ Abstracts file download/upload operations from business logic.
 
 import os
 import json
+import mmap
 from src.core.logging_config import get_logger
 import hashlib
-from typing import Optional, Dict, Any
-from datetime import datetime
+from typing import Optional, Dict, Any, List, Callable
+from datetime import datetime, date
+from decimal import Decimal
+from uuid import UUID
 import tempfile
 from pathlib import Path
 
 logger = get_logger(__name__)
 
 
+def _pass_through(value: Any) -> Any:
+    return value
+
+
+def _coerce_mapping(value: Dict[Any, Any]) -> Dict[Any, Any]:
+    return {k: _jsonable(v) for k, v in value.items()}
+
+
+def _coerce_sequence(value: Any) -> List[Any]:
+    return [_jsonable(v) for v in value]
+
+
+# JSON coercers keyed by exact type; subclasses are resolved through the
+# MRO on first sight and cached here
+_JSON_COERCERS: Dict[type, Callable[[Any], Any]] = {
+    str: _pass_through,
+    int: _pass_through,
+    float: _pass_through,
+    bool: _pass_through,
+    type(None): _pass_through,
+    dict: _coerce_mapping,
+    list: _coerce_sequence,
+    tuple: _coerce_sequence,
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    Decimal: float,
+    UUID: str,
+}
+
+
+def _jsonable(value: Any) -> Any:
+    """
+    Convert a result structure into plain JSON types in a single pass.
+    
+    Doing this up front lets json.dumps run without a ``default`` callback.
+    Unknown types fall back to ``str``, as ``default=str`` did.
+    """
+    value_type = type(value)
+    coercer = _JSON_COERCERS.get(value_type)
+    if coercer is None:
+        coercer = next(
+            (_JSON_COERCERS[base] for base in value_type.__mro__[1:] if base in _JSON_COERCERS),
+            str
+        )
+        _JSON_COERCERS[value_type] = coercer
+    return coercer(value)
+
+
+def _result_rows_schema(pa):
+    """Arrow schema of the Parquet file holding result errors and warnings."""
+    return pa.schema([
+        ("row", pa.int64()),
+        ("field", pa.string()),
+        ("value", pa.string()),
+        ("rule", pa.string()),
+        ("message", pa.string()),
+        ("severity", pa.string()),
+    ])
+
+
 class StorageService:
     """Service for handling file storage operations."""
     
@@ -38,6 +101,11 @@ class StorageService:
         
         self.s3_bucket = os.getenv("S3_BUCKET", "validahub")
         self._s3_client = None
+        
+        # Error/warning rows stay inline in the result document by default;
+        # "parquet" moves them to a results/<job_id>.parquet file referenced
+        # by rows_ref, for analytics consumers that read it directly
+        self.result_rows_format = os.getenv("RESULT_ROWS_FORMAT", "json").lower()
     
     @property
     def s3_client(self):
@@ -78,7 +146,7 @@ class StorageService:
             
             # Check if path is safe (handles both relative and absolute paths)
             if self._is_safe_path(self.temp_dir, uri):
-                if os.path.exists(uri):
+                if os.path.isfile(uri):
                     return self._read_local_file(uri)
                 else:
                     # Hash the URI for secure logging
@@ -103,15 +171,34 @@ class StorageService:
             URI of saved result
         """
         
-        result_json = json.dumps(result, indent=2, default=str)
+        rows_ref = None
+        if self.result_rows_format == "parquet":
+            rows_ref = self._save_result_rows(job_id, result)
+        
+        if rows_ref:
+            # Keep the JSON document as a small summary pointing at the rows
+            result = {k: v for k, v in result.items() if k not in ("errors", "warnings")}
+            result["rows_ref"] = rows_ref
+            result["rows_format"] = "parquet"
+        
+        result_data = _jsonable(result)
+        result_json = json.dumps(result_data, indent=2)
         
         # Try S3 first if configured
         if self.s3_client:
             try:
+                # The timestamp changes on every attempt; hash the rest so a
+                # retried task can recognise an identical stored result
+                stable = {k: v for k, v in result_data.items() if k != "timestamp"}
+                stable_hash = hashlib.md5(
+                    json.dumps(stable, sort_keys=True).encode("utf-8"),
+                    usedforsecurity=False
+                ).hexdigest()
                 return self._save_to_s3(
                     content=result_json.encode("utf-8"),
                     key=f"results/{job_id}.json",
-                    content_type="application/json"
+                    content_type="application/json",
+                    content_hash=stable_hash
                 )
             except Exception as e:
                 logger.error(f"Failed to save to S3: {e}")
@@ -146,6 +233,62 @@ class StorageService:
     
     # Private methods
     
+    def _save_result_rows(self, job_id: str, result: Dict[str, Any]) -> Optional[str]:
+        """
+        Save error and warning rows of a result as a Parquet file.
+        
+        Returns:
+            URI of the Parquet file, or None if there are no rows, pyarrow
+            is not installed or the S3 upload failed
+        """
+        rows = self._result_rows(result)
+        if not rows:
+            return None
+        
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            logger.debug("pyarrow not installed, keeping result rows in JSON")
+            return None
+        
+        table = pa.Table.from_pylist(rows, schema=_result_rows_schema(pa)).sort_by("row")
+        buffer = pa.BufferOutputStream()
+        pq.write_table(table, buffer, compression="zstd", use_dictionary=True)
+        content = buffer.getvalue().to_pybytes()
+        
+        if self.s3_client:
+            try:
+                return self._save_to_s3(
+                    content=content,
+                    key=f"results/{job_id}.parquet",
+                    content_type="application/vnd.apache.parquet"
+                )
+            except Exception as e:
+                # A local file would be unreachable from an S3 summary;
+                # keep the rows inline in the result JSON instead
+                logger.error(f"Failed to save result rows to S3, keeping them in JSON: {e}")
+                return None
+        
+        return self._save_binary_to_local(content=content, path=f"{job_id}.parquet")
+    
+    def _result_rows(self, result: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Flatten result errors and warnings into uniformly typed rows."""
+        rows = []
+        for severity, items in (("ERROR", result.get("errors", [])), ("WARNING", result.get("warnings", []))):
+            for item in items:
+                value = item.get("value")
+                rows.append({
+                    "row": item.get("row"),
+                    "field": item.get("field"),
+                    # Cell values have mixed types; store their text form
+                    "value": None if value is None else str(value),
+                    "rule": item.get("rule"),
+                    "message": item.get("message"),
+                    "severity": severity
+                })
+        return rows
+    
     def _download_from_s3(self, uri: str) -> str:
         """Download file from S3."""
         
@@ -248,8 +391,18 @@ class StorageService:
             raise FileNotFoundError("File not found")
         
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                return f.read()
+            with open(path, "rb") as f:
+                # Empty files cannot be memory-mapped
+                if os.fstat(f.fileno()).st_size == 0:
+                    return ""
+                # Decode straight from the mapped pages instead of copying the
+                # whole file into an intermediate bytes buffer first
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    content = str(mm, "utf-8")
+            # Match text-mode reads, which turn \r\n and \r into \n
+            if "\r" in content:
+                content = content.replace("\r\n", "\n").replace("\r", "\n")
+            return content
         except FileNotFoundError:
             logger.error("Local file not found")
             raise
@@ -261,9 +414,17 @@ class StorageService:
         self, 
         content: bytes, 
         key: str, 
-        content_type: Optional[str] = None
+        content_type: Optional[str] = None,
+        content_hash: Optional[str] = None
     ) -> str:
-        """Save content to S3."""
+        """
+        Save content to S3.
+        
+        Callers that may rewrite the same key on a retry pass
+        ``content_hash``: it is stored in the object metadata, and an
+        object already holding that hash skips the PUT. Without it the
+        content is uploaded straight away.
+        """
         
         if not self.s3_client:
             raise ValueError("S3 not configured")
@@ -274,6 +435,12 @@ class StorageService:
             "Body": content
         }
         
+        if content_hash is not None:
+            if self._s3_object_hash(key) == content_hash:
+                logger.debug(f"S3 object already up to date, skipping upload. Key hash: {self._hash_string(key)}")
+                return f"s3://{self.s3_bucket}/{key}"
+            put_args["Metadata"] = {"content-hash": content_hash}
+        
         if content_type:
             put_args["ContentType"] = content_type
         
@@ -281,6 +448,23 @@ class StorageService:
         
         return f"s3://{self.s3_bucket}/{key}"
     
+    def _s3_object_hash(self, key: str) -> Optional[str]:
+        """
+        Return the stored content hash of an S3 object, or None if unknown.
+        
+        Any HEAD failure counts as unknown so the caller uploads anyway:
+        without s3:ListBucket a missing key answers 403 rather than 404,
+        and that must not push the save onto the local fallback.
+        """
+        from botocore.exceptions import ClientError
+        
+        try:
+            response = self.s3_client.head_object(Bucket=self.s3_bucket, Key=key)
+        except ClientError as e:
+            logger.debug(f"S3 HEAD failed ({e.response.get('Error', {}).get('Code')}), uploading anyway")
+            return None
+        return response.get("Metadata", {}).get("content-hash")
+    
     def _save_to_local(self, content: str, path: str) -> str:
         """Save text content to local file."""
         
@@ -16,6 +16,7 @@ from src.models.job import Job, JobStatus
 from src.config import settings
 from src.config.queue_config import get_queue_config
 from src.telemetry.job_telemetry import get_job_telemetry
+from src.core.config import QueueConfig
 
 setup_logging()
 logger = get_logger(__name__)
@@ -100,7 +101,11 @@ def create_celery_app() -> Celery:
         task_time_limit=300,  # 5 minutes hard limit
         task_soft_time_limit=270,  # 4.5 minutes soft limit
         task_acks_late=True,
-        worker_prefetch_multiplier=1,  # Fair processing
+        # Long validation tasks must not be prefetched: a worker holding several
+        # jobs blocks them behind a slow one while other workers sit idle.
+        worker_prefetch_multiplier=QueueConfig.WORKER_PREFETCH_MULTIPLIER,
+        # Recycle worker processes to release pandas/boto3 memory
+        worker_max_tasks_per_child=QueueConfig.WORKER_MAX_TASKS_PER_CHILD,
         
         # Retry configuration
         task_retry_max=3,
@@ -0,0 +1,105 @@
+"""
+Buffered job progress reporting for Celery tasks.
+"""
+
+import time
+from src.core.logging_config import get_logger
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = get_logger(__name__)
+
+
+class ProgressBuffer:
+    """
+    Coalesce job progress updates into fewer backend writes.
+
+    Every progress update normally costs a database write plus a telemetry
+    event. For small jobs those round-trips can take longer than the work
+    itself, so intermediate steps are kept locally and only flushed when
+    progress advances by at least ``min_step`` or reaches 100. All recorded
+    transitions are logged once when the buffer closes.
+
+    Usage:
+        with ProgressBuffer(task_id, job_id, "validate_csv_job", params,
+                            update_job_progress, telemetry) as progress:
+            progress.update(10, "Downloading input file")
+            ...
+    """
+
+    def __init__(
+        self,
+        task_id: str,
+        job_id: str,
+        task_name: str,
+        params: Dict[str, Any],
+        update_fn: Callable[[str, float, Optional[str]], None],
+        telemetry: Optional[Any] = None,
+        min_step: float = 40
+    ):
+        """
+        Initialize the buffer.
+
+        Args:
+            task_id: Celery task id used for job progress updates
+            job_id: Job UUID used for telemetry events
+            task_name: Task name reported in telemetry events
+            params: Job parameters (marketplace/category context for telemetry)
+            update_fn: Function persisting job progress, e.g. update_job_progress
+            telemetry: Optional JobTelemetry used to emit job.progress events
+            min_step: Minimum progress increase that triggers a flush
+        """
+        self.task_id = task_id
+        self.job_id = job_id
+        self.task_name = task_name
+        self.params = params
+        self.update_fn = update_fn
+        self.telemetry = telemetry
+        self.min_step = min_step
+
+        self._start = time.monotonic()
+        self._transitions: List[Tuple[float, str, float]] = []
+        self._pending: Optional[Tuple[float, str]] = None
+        self._last_flushed: Optional[float] = None
+
+    def __enter__(self) -> "ProgressBuffer":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        # On failure the task_failure handler owns the final job state
+        if exc_type is None:
+            self.flush()
+        logger.debug(
+            f"Progress transitions for {self.task_name} job_id={self.job_id}: "
+            f"{[(p, m, round(t * 1000)) for p, m, t in self._transitions]}"
+        )
+
+    def update(self, progress: float, message: str) -> None:
+        """Record a progress step, flushing it if it is significant."""
+        self._transitions.append((progress, message, time.monotonic() - self._start))
+        self._pending = (progress, message)
+
+        if (
+            self._last_flushed is None
+            or progress >= 100
+            or progress - self._last_flushed >= self.min_step
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the latest pending progress step to the backends."""
+        if self._pending is None:
+            return
+
+        progress, message = self._pending
+        self._pending = None
+        self._last_flushed = progress
+
+        self.update_fn(self.task_id, progress, message)
+        if self.telemetry is not None:
+            self.telemetry.emit_job_progress(
+                job_id=self.job_id,
+                task_name=self.task_name,
+                progress=progress,
+                message=message,
+                params=self.params
+            )
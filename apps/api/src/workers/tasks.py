@@ -3,15 +3,20 @@ Celery tasks for async job processing.
 """
 
 import os
+import errno
 import json
 from src.core.logging_config import get_logger
 import tempfile
-from typing import Dict, Any, Optional
+import time
+from typing import Callable, Dict, Any, FrozenSet, Optional, Tuple, Type
 from datetime import datetime
+from functools import lru_cache, partial
 import pandas as pd
 import io
+from celery.signals import worker_process_init
 
 from .celery_app import celery_app, DatabaseTask, update_job_progress
+from .progress import ProgressBuffer
 from ..services.rule_engine_service import RuleEngineService
 from src.core.pipeline.validation_pipeline import ValidationPipeline
 from ..services.csv_validation_service import CSVValidationService
@@ -19,15 +24,110 @@ from ..services.storage_service import get_storage_service
 from exceptions import TransientError, MissingParameterError
 from src.telemetry.job_telemetry import get_job_telemetry
 from src.telemetry.metrics import MetricsCollector, ValidationMetrics
-from src.core.config import QueueConfig
+from src.core.config import QueueConfig, ValidationConfig
 
 logger = get_logger(__name__)
 
 
+# Transient error classification tables, built once at import time
+
+# Standard Python transient exception types
+_TRANSIENT_NETWORK_TYPES: Tuple[Type[BaseException], ...] = (
+    ConnectionError,        # Network connection errors
+    TimeoutError,           # Operation timeouts
+    BrokenPipeError,        # Broken network pipe
+    ConnectionResetError,   # Connection reset by peer
+    ConnectionAbortedError, # Connection aborted
+)
+
+# errno values that indicate transient network issues
+_TRANSIENT_ERRNO: FrozenSet[int] = frozenset({
+    errno.EAGAIN,       # Resource temporarily unavailable
+    errno.EWOULDBLOCK,  # Operation would block
+    errno.EINPROGRESS,  # Operation in progress
+    errno.ETIMEDOUT,    # Connection timed out
+    errno.ECONNRESET,   # Connection reset by peer
+    errno.ECONNREFUSED, # Connection refused
+    errno.EHOSTUNREACH, # No route to host
+    errno.ENETUNREACH,  # Network unreachable
+    errno.ENETDOWN,     # Network is down
+})
+
+# AWS error codes that indicate throttling or temporary unavailability
+_TRANSIENT_AWS_CODES: FrozenSet[str] = frozenset({
+    'ThrottlingException',
+    'TooManyRequestsException',
+    'RequestLimitExceeded',
+    'ServiceUnavailable',
+    'RequestTimeout',
+    'InternalServerError',
+    'InternalError',
+})
+
+try:
+    from botocore.exceptions import (
+        ClientError as _AWS_CLIENT_ERROR,
+        EndpointConnectionError,
+        ConnectTimeoutError,
+        ReadTimeoutError,
+        ConnectionClosedError,
+    )
+    _AWS_TRANSIENT_TYPES: Tuple[Type[BaseException], ...] = (
+        EndpointConnectionError,
+        ConnectTimeoutError,
+        ReadTimeoutError,
+        ConnectionClosedError,
+    )
+except ImportError:
+    _AWS_CLIENT_ERROR = None
+    _AWS_TRANSIENT_TYPES = ()
+
+
+@lru_cache(maxsize=1)
+def _validation_service() -> CSVValidationService:
+    """
+    Get the process-wide validation service.
+    
+    The service is stateless between calls and its rule engine caches compiled
+    rulesets per marketplace, so sharing one instance avoids reloading YAML
+    rules and rebuilding engines on every task.
+    """
+    return CSVValidationService()
+
+
+@lru_cache(maxsize=128)
+def _validation_runner(marketplace: str, category: str, ruleset: str) -> Callable[..., Any]:
+    """
+    Get a validation callable specialized for one marketplace/category/ruleset.
+    
+    The set of combinations in use is small and stable, so binding the
+    target once turns per-task dispatch into a cache lookup. The returned
+    callable takes ``csv_content`` and ``auto_fix``.
+    """
+    return partial(
+        _validation_service().validate_csv_content,
+        marketplace=marketplace,
+        category=category,
+        ruleset=ruleset
+    )
+
+
+@worker_process_init.connect
+def warm_validation_service(**kwargs):
+    """Compile rule engines for commonly used marketplaces on worker start."""
+    service = _validation_service()
+    for marketplace in ValidationConfig.PRELOAD_MARKETPLACES:
+        try:
+            service.rule_engine.get_engine_for_marketplace(marketplace)
+        except Exception as e:
+            logger.warning(f"Could not preload rule engine for {marketplace}: {e}")
+
+
 @celery_app.task(
     bind=True,
     base=DatabaseTask,
     name="validate_csv_job",
+    acks_late=True,
     autoretry_for=(TransientError, ConnectionError, TimeoutError),
     retry_backoff=2,
     retry_jitter=True,
@@ -65,197 +165,57 @@ def validate_csv_job(
     logger.info(f"Starting validate_csv_job: job_id={job_id}, task_id={task_id}")
     
     try:
-        # Track start time for metrics
-        start_time = datetime.utcnow()
+        # Track start time for metrics (monotonic, immune to clock changes)
+        start_ns = time.monotonic_ns()
         
         # Initialize services
-        validation_service = CSVValidationService()
         storage_service = get_storage_service()
         telemetry = get_job_telemetry()
         
-        # Update progress: Starting
-        update_job_progress(task_id, 10, "Downloading input file")
-        
-        # Emit progress with enhanced metrics
-        telemetry.emit_job_progress(
-            job_id=job_id, 
-            task_name="validate_csv_job", 
-            progress=10, 
-            message="Downloading input file", 
-            params=params
-        )
-        
-        # Get input file
-        input_uri = params.get("input_uri")
-        if not input_uri:
-            raise MissingParameterError(
-                "input_uri is required in params for validate_csv_job",
-                parameter_name="input_uri"
-            )
-        
-        # Validate input_uri format
-        if not isinstance(input_uri, str):
-            raise ValueError(f"input_uri must be a string, got {type(input_uri).__name__}")
-        
-        # Validate URI scheme and path safety
-        if input_uri.startswith("s3://"):
-            # S3 URIs are handled by storage service
-            pass
-        elif input_uri.startswith("/") or input_uri.startswith("./"):
-            # Local file paths - validate for path traversal
-            from pathlib import Path
-            import urllib.parse
+        # Progress steps are coalesced so small jobs don't pay a DB write and
+        # a telemetry event for every step
+        with ProgressBuffer(
+            task_id, job_id, "validate_csv_job", params, update_job_progress, telemetry
+        ) as progress:
+            progress.update(10, "Downloading input file")
             
-            # Decode any URL-encoded sequences (handles all encoding variants)
-            decoded_uri = urllib.parse.unquote(input_uri, errors='replace')
+            # Get input file
+            input_uri = params.get("input_uri")
+            _check_input_uri(input_uri)
             
-            # Resolve to absolute path - this canonicalizes the path and resolves any '..' components
-            # Path.resolve() is the most robust way to prevent path traversal
-            file_path = Path(decoded_uri).resolve()
+            # Download or read file using storage service
+            csv_content = storage_service.download_file(input_uri)
             
-            # Define allowed base directories for input files
-            allowed_dirs = [
-                Path(tempfile.gettempdir()).resolve(),
-                Path(os.path.expanduser("~/.local/share/validahub")).resolve(),
-            ]
+            # Check file size to prevent memory issues
+            content_size = _check_content_size(csv_content)
             
-            # Check if file is within any allowed directory
-            is_allowed = any(
-                file_path.is_relative_to(allowed_dir) or file_path == allowed_dir
-                for allowed_dir in allowed_dirs
-            )
+            progress.update(30, f"File loaded ({content_size} bytes), starting validation")
             
-            if not is_allowed:
-                raise ValueError(
-                    f"Input file must be within allowed directories (temp or validahub data dir): {input_uri[:50]}"
-                )
-        else:
-            raise ValueError(
-                f"Invalid input_uri format. Must be an S3 URI (s3://...) or absolute/relative file path, got: {input_uri[:50]}"
-            )
-        
-        # Download or read file using storage service
-        csv_content = storage_service.download_file(input_uri)
-        
-        # Check file size to prevent memory issues
-        content_size = len(csv_content.encode('utf-8'))
-        if content_size > ValidationConfig.MAX_CSV_FILE_SIZE:
-            raise ValueError(
-                f"CSV file size ({content_size / (1024*1024):.2f}MB) exceeds maximum allowed size "
-                f"({ValidationConfig.MAX_CSV_FILE_SIZE / (1024*1024):.2f}MB). "
-                "Consider splitting the file or using batch processing."
-            )
-        
-        # Update progress: File loaded
-        update_job_progress(task_id, 30, "File loaded, starting validation")
-        
-        # Emit progress with payload size metric
-        progress_metrics = {
-            "payload_size_bytes": len(csv_content.encode('utf-8'))
-        }
-        telemetry.emit_job_progress(
-            job_id=job_id,
-            task_name="validate_csv_job",
-            progress=30,
-            message=f"File loaded ({progress_metrics['payload_size_bytes']} bytes), starting validation",
-            params={**params, "metrics": progress_metrics}
-        )
-        
-        logger.info(f"Loaded CSV with {len(csv_content)} bytes")
-        
-        # Update progress: Validating
-        update_job_progress(task_id, 50, "Validating data")
-        telemetry.emit_job_progress(
-            job_id=job_id,
-            task_name="validate_csv_job",
-            progress=50,
-            message="Validating data",
-            params=params
-        )
-        
-        # Extract parameters
-        marketplace = params.get("marketplace", "mercado_livre")
-        category = params.get("category", "general")
-        ruleset = params.get("ruleset", "default")
-        auto_fix = params.get("auto_fix", False)
-        
-        # Use domain service for validation
-        validation_result, corrected_csv = validation_service.validate_csv_content(
-            csv_content=csv_content,
-            marketplace=marketplace,
-            category=category,
-            ruleset=ruleset,
-            auto_fix=auto_fix
-        )
-        
-        # Calculate standardized business metrics
-        validation_metrics = MetricsCollector.collect_validation_metrics(
-            csv_content=csv_content,
-            validation_result=validation_result,
-            processing_time_ms=int((datetime.utcnow() - start_time).total_seconds() * 1000)
-        )
-        
-        # Enrich with business context
-        validation_metrics = MetricsCollector.enrich_with_business_context(
-            validation_metrics, params
-        )
-        
-        # Calculate error rates
-        # Note: For very large CSV files (>1GB), consider streaming metrics calculation
-        # or deferring detailed metrics to a separate background task
-        error_rates = MetricsCollector.calculate_error_rates(validation_metrics)
-        
-        # Convert to dict for serialization (optimized)
-        metrics = {**validation_metrics.to_dict(), **error_rates}
-        
-        # Update progress: Saving results with metrics
-        update_job_progress(task_id, 80, "Saving validation results")
-        
-        # Emit progress with preliminary metrics
-        telemetry.emit_job_progress(
-            job_id=job_id,
-            task_name="validate_csv_job",
-            progress=80,
-            message=f"Saving results ({validation_result['total_rows']} rows processed)",
-            params={**params, "preliminary_metrics": {
-                "total_rows": validation_result["total_rows"],
-                "error_rows": validation_result["error_rows"]
-            }}
-        )
-        
-        # Add metadata to validation result
-        validation_result["job_id"] = job_id
-        validation_result["timestamp"] = datetime.utcnow().isoformat()
-        
-        # Save result to storage using storage service
-        result_ref = storage_service.save_result(job_id, validation_result)
-        
-        # Save corrected data if available
-        if corrected_csv:
-            corrected_ref = storage_service.save_file(
-                f"corrected/{job_id}.csv",
-                corrected_csv.encode('utf-8')
-            )
-            validation_result["corrected_file"] = corrected_ref
-        
-        # Update progress: Complete
-        update_job_progress(task_id, 100, "Validation completed")
+            logger.info(f"Loaded CSV with {len(csv_content)} bytes")
+            
+            progress.update(50, "Validating data")
+            
+            # Extract parameters
+            marketplace = params.get("marketplace", "mercado_livre")
+            category = params.get("category", "general")
+            ruleset = params.get("ruleset", "default")
+            auto_fix = params.get("auto_fix", False)
+            
+            # Use domain service for validation
+            validate = _validation_runner(marketplace, category, ruleset)
+            validation_result, corrected_csv = validate(csv_content=csv_content, auto_fix=auto_fix)
+            
+            metrics = _collect_metrics(csv_content, validation_result, params, start_ns)
+            
+            progress.update(80, f"Saving results ({validation_result['total_rows']} rows processed)")
+            
+            result_ref = _save_validation_result(job_id, validation_result, corrected_csv, storage_service)
+            
+            progress.update(100, "Validation completed")
         
         logger.info(f"Validation completed: job_id={job_id}, result_ref={result_ref}")
         
-        return {
-            "result_ref": result_ref,
-            "summary": {
-                "total_rows": validation_result["total_rows"],
-                "valid_rows": validation_result["valid_rows"],
-                "error_rows": validation_result["error_rows"],
-                "warning_rows": validation_result["warning_rows"]
-            },
-            "status": "success",
-            "marketplace": marketplace,
-            "category": category,
-            "metrics": metrics
-        }
+        return _build_job_result(result_ref, validation_result, marketplace, category, metrics)
         
     except Exception as e:
         logger.error(f"Error in validate_csv_job: {e}", exc_info=True)
@@ -272,6 +232,7 @@ def validate_csv_job(
     bind=True,
     base=DatabaseTask,
     name="correct_csv_job",
+    acks_late=True,
     autoretry_for=(TransientError,),
     retry_backoff=2,
     max_retries=3,
@@ -347,49 +308,166 @@ def generate_report_job(
 
 # Helper functions
 
-def _is_aws_transient_error(error: Exception) -> bool:
+def _check_input_uri(input_uri: Any) -> None:
     """
-    Check if error is an AWS-specific transient error.
+    Validate the input URI parameter of a validation job.
+    
+    Raises:
+        MissingParameterError: If no URI was given
+        ValueError: If the URI is malformed or points outside allowed directories
     """
-    # Lazy import boto3 exceptions only when needed
-    try:
-        from botocore.exceptions import ClientError
-    except ImportError:
-        return False
+    if not input_uri:
+        raise MissingParameterError(
+            "input_uri is required in params for validate_csv_job",
+            parameter_name="input_uri"
+        )
     
-    # Check for specific AWS transient errors
-    if isinstance(error, ClientError):
-        error_code = error.response.get('Error', {}).get('Code', '')
-        transient_error_codes = [
-            'ThrottlingException',
-            'TooManyRequestsException',
-            'RequestLimitExceeded',
-            'ServiceUnavailable',
-            'RequestTimeout',
-            'InternalServerError',
-            'InternalError'
+    # Validate input_uri format
+    if not isinstance(input_uri, str):
+        raise ValueError(f"input_uri must be a string, got {type(input_uri).__name__}")
+    
+    # Validate URI scheme and path safety
+    if input_uri.startswith("s3://"):
+        # S3 URIs are handled by storage service
+        pass
+    elif input_uri.startswith("/") or input_uri.startswith("./"):
+        # Local file paths - validate for path traversal
+        from pathlib import Path
+        import urllib.parse
+        
+        # Decode any URL-encoded sequences (handles all encoding variants)
+        decoded_uri = urllib.parse.unquote(input_uri, errors='replace')
+        
+        # Resolve to absolute path - this canonicalizes the path and resolves any '..' components
+        # Path.resolve() is the most robust way to prevent path traversal
+        file_path = Path(decoded_uri).resolve()
+        
+        # Define allowed base directories for input files
+        allowed_dirs = [
+            Path(tempfile.gettempdir()).resolve(),
+            Path(os.path.expanduser("~/.local/share/validahub")).resolve(),
         ]
-        if error_code in transient_error_codes:
-            return True
+        
+        # Check if file is within any allowed directory
+        is_allowed = any(
+            file_path.is_relative_to(allowed_dir) or file_path == allowed_dir
+            for allowed_dir in allowed_dirs
+        )
+        
+        if not is_allowed:
+            raise ValueError(
+                f"Input file must be within allowed directories (temp or validahub data dir): {input_uri[:50]}"
+            )
+    else:
+        raise ValueError(
+            f"Invalid input_uri format. Must be an S3 URI (s3://...) or absolute/relative file path, got: {input_uri[:50]}"
+        )
+
+
+def _check_content_size(csv_content: str) -> int:
+    """
+    Check CSV content against the configured size limit.
     
-    # AWS connection errors
-    try:
-        from botocore.exceptions import (
-            EndpointConnectionError,
-            ConnectTimeoutError,
-            ReadTimeoutError,
-            ConnectionClosedError
+    Returns:
+        Content size in bytes
+    """
+    content_size = len(csv_content.encode('utf-8'))
+    if content_size > ValidationConfig.MAX_CSV_FILE_SIZE:
+        raise ValueError(
+            f"CSV file size ({content_size / (1024*1024):.2f}MB) exceeds maximum allowed size "
+            f"({ValidationConfig.MAX_CSV_FILE_SIZE / (1024*1024):.2f}MB). "
+            "Consider splitting the file or using batch processing."
         )
-        aws_transient_types = (
-            EndpointConnectionError,
-            ConnectTimeoutError,
-            ReadTimeoutError,
-            ConnectionClosedError,
+    return content_size
+
+
+def _collect_metrics(
+    csv_content: str,
+    validation_result: Dict[str, Any],
+    params: Dict[str, Any],
+    start_ns: int
+) -> Dict[str, Any]:
+    """Collect business metrics and error rates for a validation run."""
+    # Calculate standardized business metrics
+    validation_metrics = MetricsCollector.collect_validation_metrics(
+        csv_content=csv_content,
+        validation_result=validation_result,
+        processing_time_ms=(time.monotonic_ns() - start_ns) // 1_000_000
+    )
+    
+    # Enrich with business context
+    validation_metrics = MetricsCollector.enrich_with_business_context(
+        validation_metrics, params
+    )
+    
+    # Calculate error rates
+    # Note: For very large CSV files (>1GB), consider streaming metrics calculation
+    # or deferring detailed metrics to a separate background task
+    error_rates = MetricsCollector.calculate_error_rates(validation_metrics)
+    
+    # Convert to dict for serialization (optimized)
+    return {**validation_metrics.to_dict(), **error_rates}
+
+
+def _save_validation_result(
+    job_id: str,
+    validation_result: Dict[str, Any],
+    corrected_csv: Optional[str],
+    storage_service
+) -> str:
+    """Persist the validation result and any corrected CSV, returning the result URI."""
+    # Add metadata to validation result
+    validation_result["job_id"] = job_id
+    validation_result["timestamp"] = datetime.utcnow().isoformat()
+    
+    # Save result to storage using storage service
+    result_ref = storage_service.save_result(job_id, validation_result)
+    
+    # Save corrected data if available
+    if corrected_csv:
+        corrected_ref = storage_service.save_file(
+            f"corrected/{job_id}.csv",
+            corrected_csv.encode('utf-8')
         )
-        if isinstance(error, aws_transient_types):
-            return True
-    except ImportError:
-        pass
+        validation_result["corrected_file"] = corrected_ref
+    
+    return result_ref
+
+
+def _build_job_result(
+    result_ref: str,
+    validation_result: Dict[str, Any],
+    marketplace: str,
+    category: str,
+    metrics: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Build the task return payload for a completed validation."""
+    return {
+        "result_ref": result_ref,
+        "summary": {
+            "total_rows": validation_result["total_rows"],
+            "valid_rows": validation_result["valid_rows"],
+            "error_rows": validation_result["error_rows"],
+            "warning_rows": validation_result["warning_rows"]
+        },
+        "status": "success",
+        "marketplace": marketplace,
+        "category": category,
+        "metrics": metrics
+    }
+
+
+def _is_aws_transient_error(error: Exception) -> bool:
+    """
+    Check if error is an AWS-specific transient error.
+    """
+    if _AWS_TRANSIENT_TYPES and isinstance(error, _AWS_TRANSIENT_TYPES):
+        return True
+    
+    # Check for specific AWS transient error codes
+    if _AWS_CLIENT_ERROR is not None and isinstance(error, _AWS_CLIENT_ERROR):
+        error_code = error.response.get('Error', {}).get('Code', '')
+        return error_code in _TRANSIENT_AWS_CODES
     
     return False
 
@@ -398,37 +476,11 @@ def _is_network_transient_error(error: Exception) -> bool:
     """
     Check if error is a network-related transient error.
     """
-    # Standard Python transient exception types
-    transient_types = (
-        ConnectionError,      # Network connection errors
-        TimeoutError,        # Operation timeouts
-        BrokenPipeError,     # Broken network pipe
-        ConnectionResetError, # Connection reset by peer
-        ConnectionAbortedError, # Connection aborted
-    )
-    
-    if isinstance(error, transient_types):
+    if isinstance(error, _TRANSIENT_NETWORK_TYPES):
         return True
     
     # Check for specific OSError types that are transient
-    if isinstance(error, OSError):
-        # errno values that indicate transient network issues
-        import errno
-        transient_errno = [
-            errno.EAGAIN,      # Resource temporarily unavailable
-            errno.EWOULDBLOCK, # Operation would block
-            errno.EINPROGRESS, # Operation in progress
-            errno.ETIMEDOUT,   # Connection timed out
-            errno.ECONNRESET,  # Connection reset by peer
-            errno.ECONNREFUSED, # Connection refused
-            errno.EHOSTUNREACH, # No route to host
-            errno.ENETUNREACH,  # Network unreachable
-            errno.ENETDOWN,     # Network is down
-        ]
-        if hasattr(error, 'errno') and error.errno in transient_errno:
-            return True
-    
-    return False
+    return isinstance(error, OSError) and error.errno in _TRANSIENT_ERRNO
 
 
 def _is_transient_error(error: Exception) -> bool:
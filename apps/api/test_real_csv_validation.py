@@ -13,162 +13,428 @@ sys.path.insert(0, str(src_path))
 
 # Now import only what we need, avoiding the problematic __init__.py
 import yaml
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 from typing import Dict, Any, List, Tuple
 import re
+import functools
+from dataclasses import dataclass
+
+# libyaml-backed loader when available, pure-Python SafeLoader otherwise
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 
 # Inline PolicyLoader to avoid import issues
 class SimplePolicyLoader:
     def __init__(self):
         self.policies_dir = Path(__file__).parent / "policies"
+        # (marketplace, category) -> ((mtime_ns, size), policy, compiled policy)
+        self._cache: Dict[Tuple[str, str], Tuple[Tuple[int, int], Dict, CompiledPolicy]] = {}
+        self._policy_paths: Dict[Tuple[str, str], Path] = {}
     
     def get_policy(self, marketplace: str, category: str) -> Dict:
-        policy_file = self.policies_dir / marketplace / "categories" / f"{category}.yml"
-        if policy_file.exists():
-            with open(policy_file) as f:
-                return yaml.safe_load(f)
-        return {}
+        return self._load(marketplace, category)[0]
+    
+    def get_compiled_policy(self, marketplace: str, category: str) -> "CompiledPolicy":
+        return self._load(marketplace, category)[1]
+    
+    def _load(self, marketplace: str, category: str) -> Tuple[Dict, "CompiledPolicy"]:
+        key = (marketplace, category)
+        policy_file = self._policy_paths.get(key)
+        if policy_file is None:
+            policy_file = self._policy_paths[key] = self.policies_dir / marketplace / "categories" / f"{category}.yml"
+        try:
+            stat = policy_file.stat()
+        except OSError:
+            return {}, CompiledPolicy({})
+        
+        # Reparse only when the file changed on disk
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1], cached[2]
+        
+        with open(policy_file) as f:
+            policy = yaml.load(f, Loader=_YamlLoader)
+        compiled = CompiledPolicy(policy)
+        self._cache[key] = (stamp, policy, compiled)
+        return policy, compiled
+
+
+class CompiledPolicy:
+    """Validator plan for one policy, built once instead of per row."""
+    
+    def __init__(self, policy: Dict):
+        # (field, spec) pairs in policy order; non-dict rules are dropped here
+        self.field_specs: List[Tuple[str, Dict]] = []
+        for field, field_rules in policy.get("rules", {}).items():
+            if not isinstance(field_rules, dict):
+                continue
+            enum_values = field_rules.get("enum_values")
+            if enum_values is not None:
+                if not field_rules.get("case_sensitive", True):
+                    enum_values = [v.lower() for v in enum_values]
+                enum_values = frozenset(enum_values)
+            forbidden = field_rules.get("forbidden_chars")
+            self.field_specs.append((field, {
+                "rules": field_rules,
+                "errors": _error_texts(field, field_rules),
+                "enum_values": enum_values,
+                "enum_array": pa.array(sorted(enum_values), type=pa.string()) if enum_values is not None else None,
+                # Entries may be multi-character ("script"), so use an alternation
+                "forbidden_re": re.compile("|".join(map(re.escape, forbidden))) if forbidden else None,
+            }))
+        # (attribute, lower-case column key, code, message) for required custom
+        # attributes, the only ones the simplified engine checks
+        self.required_attributes: List[Tuple[str, str, str, str]] = [
+            (attr, attr.lower(), f"{attr}_REQUIRED", f"{attr} is required")
+            for attr, attr_rules in policy.get("custom_attributes", {}).items()
+            if attr_rules.get("required")
+        ]
+        
+        self.has_rules = bool(self.field_specs)
+        self.has_custom_attrs = bool(self.required_attributes)
+        
+        # CSV columns any check can read
+        self.columns = frozenset(
+            [field for field, _ in self.field_specs]
+            + [name for attr, lower_key, _, _ in self.required_attributes for name in (attr, lower_key)]
+        )
+
+
+def _error_texts(field: str, field_rules: Dict) -> Dict[str, Tuple[str, str]]:
+    """Error code and message per check; the forbidden message is completed with the char."""
+    prefix = field.upper()
+    texts = {
+        "required": (f"{prefix}_REQUIRED", f"{field} is required"),
+        "forbidden": (f"{prefix}_FORBIDDEN_CHARS", f"{field} contains forbidden character: "),
+        "not_numeric": (f"{prefix}_NOT_NUMERIC", f"{field} must be numeric"),
+    }
+    if "min_length" in field_rules:
+        texts["too_short"] = (f"{prefix}_TOO_SHORT", f"{field} must be at least {field_rules['min_length']} characters")
+    if "max_length" in field_rules:
+        texts["too_long"] = (f"{prefix}_TOO_LONG", f"{field} cannot exceed {field_rules['max_length']} characters")
+    if "min_value" in field_rules:
+        texts["too_low"] = (f"{prefix}_TOO_LOW", f"{field} must be at least {field_rules['min_value']}")
+    if "max_value" in field_rules:
+        texts["too_high"] = (f"{prefix}_TOO_HIGH", f"{field} cannot exceed {field_rules['max_value']}")
+    if "enum_values" in field_rules:
+        texts["invalid_value"] = (
+            f"{prefix}_INVALID_VALUE", f"{field} must be one of: {', '.join(field_rules['enum_values'][:5])}..."
+        )
+    return texts
+
+
+def _arrow_mask(mask: pa.Array) -> np.ndarray:
+    """Arrow boolean result as a NumPy mask, with nulls as False."""
+    return pc.fill_null(mask, False).to_numpy(zero_copy_only=False)
+
+
+def _first_forbidden(field_rules: Dict, value: str) -> str:
+    """First forbidden entry, in policy order, contained in value."""
+    return next(char for char in field_rules["forbidden_chars"] if char in value)
 
 
 # Inline ValidationError
+@dataclass(frozen=True, slots=True)
 class ValidationError:
-    def __init__(self, field: str, code: str, message: str, value: Any = None, severity: str = "ERROR"):
-        self.field = field
-        self.code = code
-        self.message = message
-        self.value = value
-        self.severity = severity
+    field: str
+    code: str
+    message: str
+    value: Any = None
+    severity: str = "ERROR"
 
 
 # Simplified RuleEngine
 class SimpleRuleEngine:
+    NUMERIC_FIELDS = ("price", "stock")
+    
     def __init__(self, policy_loader):
         self.loader = policy_loader
     
+    def prepare(self, marketplace: str, category: str) -> CompiledPolicy:
+        """Resolve the validator plan once for a batch of rows."""
+        return self.loader.get_compiled_policy(marketplace, category)
+    
     def validate_row(self, row: Dict, marketplace: str, category: str) -> Tuple[bool, List[ValidationError]]:
-        policy = self.loader.get_policy(marketplace, category)
-        rules = policy.get("rules", {})
+        return self.validate_row_plan(row, self.prepare(marketplace, category))
+    
+    def validate_row_plan(self, row: Dict, plan: CompiledPolicy) -> Tuple[bool, List[ValidationError]]:
+        if not plan.has_rules and not plan.has_custom_attrs:
+            return True, []
+        
         errors = []
+        # Bound once for the loops below
+        validate_value = self._validate_value
+        get_value = row.get
         
         # Check required fields
-        for field, field_rules in rules.items():
-            if not isinstance(field_rules, dict):
-                continue
+        for field, spec in plan.field_specs:
+            validate_value(field, spec, get_value(field), errors)
+        
+        # Check custom attributes
+        if plan.has_custom_attrs:
+            append_error = errors.append
+            for attr, lower_key, code, message in plan.required_attributes:
+                value = get_value(lower_key) or get_value(attr)
+                
+                if not value:
+                    append_error(ValidationError(field=attr, code=code, message=message, value=value))
+        
+        # Only ERROR severity blocks validation
+        is_valid = not any(e.severity == "ERROR" for e in errors)
+        return is_valid, errors
+    
+    def validate_frame(self, df: pd.DataFrame, marketplace: str, category: str) -> List[Tuple[bool, List[ValidationError]]]:
+        """Validate every row of df with column-wise checks; same results as validate_row per row."""
+        plan = self.prepare(marketplace, category)
+        if not plan.has_rules and not plan.has_custom_attrs:
+            return [(True, []) for _ in range(len(df))]
+        
+        row_errors = [[] for _ in range(len(df))]
+        
+        for field, spec in plan.field_specs:
+            column = self._column(df, field)
+            if column.dtype.kind in "biuf":
+                self._validate_numeric_column(field, spec, column, row_errors)
+            elif pd.api.types.infer_dtype(column, skipna=True) in ("string", "empty"):
+                self._validate_string_column(field, spec, column, row_errors)
+            else:
+                # Mixed Python types: fall back to the row-wise checks
+                for i, value in enumerate(column.to_numpy(dtype=object)):
+                    self._validate_value(field, spec, value, row_errors[i])
+        
+        for attr, lower_key, code, message in plan.required_attributes:
+            lower = self._column(df, lower_key)
+            exact = self._column(df, attr)
+            missing = self._empty_mask(lower) & self._empty_mask(exact)
+            self._add_errors(row_errors, missing, exact.to_numpy(dtype=object), attr, code, message)
+        
+        return [
+            (not any(e.severity == "ERROR" for e in errors), errors)
+            for errors in row_errors
+        ]
+    
+    def _validate_value(self, field: str, spec: Dict, value: Any, errors: List[ValidationError]) -> None:
+        field_rules = spec["rules"]
+        texts = spec["errors"]
+        
+        # Required check
+        if field_rules.get("required") and not value:
+            code, message = texts["required"]
+            errors.append(ValidationError(field=field, code=code, message=message, value=value))
+            return
+        
+        if not value:
+            return
+        
+        # String validations
+        if isinstance(value, str):
+            # Trim
+            value = value.strip()
             
-            value = row.get(field)
+            # Length
+            if "min_length" in field_rules and len(value) < field_rules["min_length"]:
+                code, message = texts["too_short"]
+                errors.append(ValidationError(field=field, code=code, message=message, value=value))
             
-            # Required check
-            if field_rules.get("required") and not value:
+            if "max_length" in field_rules and len(value) > field_rules["max_length"]:
+                code, message = texts["too_long"]
+                errors.append(ValidationError(field=field, code=code, message=message, value=value))
+            
+            # Forbidden chars: one regex scan, the listed char is only looked up on a hit
+            forbidden_re = spec["forbidden_re"]
+            if forbidden_re is not None and forbidden_re.search(value):
+                code, message = texts["forbidden"]
                 errors.append(ValidationError(
                     field=field,
-                    code=f"{field.upper()}_REQUIRED",
-                    message=f"{field} is required",
+                    code=code,
+                    message=message + _first_forbidden(field_rules, value),
                     value=value
                 ))
-                continue
-            
-            if not value:
-                continue
-            
-            # String validations
-            if isinstance(value, str):
-                # Trim
-                value = value.strip()
-                
-                # Length
-                if "min_length" in field_rules and len(value) < field_rules["min_length"]:
-                    errors.append(ValidationError(
-                        field=field,
-                        code=f"{field.upper()}_TOO_SHORT",
-                        message=f"{field} must be at least {field_rules['min_length']} characters",
-                        value=value
-                    ))
+        
+        # Numeric validations
+        if field in self.NUMERIC_FIELDS:
+            try:
+                # Handle Brazilian format
+                if isinstance(value, str):
+                    value = value.replace(",", ".")
+                numeric_value = float(value)
                 
-                if "max_length" in field_rules and len(value) > field_rules["max_length"]:
-                    errors.append(ValidationError(
-                        field=field,
-                        code=f"{field.upper()}_TOO_LONG",
-                        message=f"{field} cannot exceed {field_rules['max_length']} characters",
-                        value=value
-                    ))
+                if "min_value" in field_rules and numeric_value < field_rules["min_value"]:
+                    code, message = texts["too_low"]
+                    errors.append(ValidationError(field=field, code=code, message=message, value=value))
                 
-                # Forbidden chars
-                if "forbidden_chars" in field_rules:
-                    for char in field_rules["forbidden_chars"]:
-                        if char in value:
-                            errors.append(ValidationError(
-                                field=field,
-                                code=f"{field.upper()}_FORBIDDEN_CHARS",
-                                message=f"{field} contains forbidden character: {char}",
-                                value=value
-                            ))
-                            break
+                if "max_value" in field_rules and numeric_value > field_rules["max_value"]:
+                    code, message = texts["too_high"]
+                    errors.append(ValidationError(field=field, code=code, message=message, value=value))
+            except (ValueError, TypeError):
+                code, message = texts["not_numeric"]
+                errors.append(ValidationError(field=field, code=code, message=message, value=value))
+        
+        # Enum validation
+        if "enum_values" in field_rules:
+            if not field_rules.get("case_sensitive", True):
+                value_str = str(value).lower()
+            else:
+                value_str = str(value)
+            
+            if value_str not in spec["enum_values"]:
+                code, message = texts["invalid_value"]
+                errors.append(ValidationError(field=field, code=code, message=message, value=value))
+    
+    def _validate_string_column(self, field: str, spec: Dict, column: pd.Series, row_errors: List[List[ValidationError]]) -> None:
+        field_rules = spec["rules"]
+        texts = spec["errors"]
+        # Cells are str or missing; NaN is truthy, so only None and "" are empty
+        values = column.to_numpy(dtype=object)
+        is_none = np.equal(values, None)
+        is_na = column.isna().to_numpy()
+        empty = self._empty_mask(column)
+        
+        if field_rules.get("required"):
+            self._add_errors(row_errors, empty, values, field, *texts["required"])
+        
+        is_str = ~is_na & ~empty
+        stripped = column.str.strip()
+        stripped_values = stripped.to_numpy(dtype=object)
+        # Length and substring checks run as Arrow kernels over the trimmed text
+        text = pa.array(stripped_values, type=pa.string(), from_pandas=True)
+        
+        if "min_length" in field_rules or "max_length" in field_rules:
+            lengths = pc.utf8_length(text)
+        
+        if "min_length" in field_rules:
+            self._add_errors(
+                row_errors, is_str & _arrow_mask(pc.less(lengths, field_rules["min_length"])), stripped_values,
+                field, *texts["too_short"]
+            )
+        
+        if "max_length" in field_rules:
+            self._add_errors(
+                row_errors, is_str & _arrow_mask(pc.greater(lengths, field_rules["max_length"])), stripped_values,
+                field, *texts["too_long"]
+            )
+        
+        if spec["forbidden_re"] is not None:
+            contains = [pc.match_substring(text, char) for char in field_rules["forbidden_chars"]]
+            hit = is_str & _arrow_mask(functools.reduce(pc.or_kleene, contains))
+            code, message = texts["forbidden"]
+            for i in np.flatnonzero(hit):
+                row_errors[i].append(ValidationError(
+                    field=field,
+                    code=code,
+                    message=message + _first_forbidden(field_rules, stripped_values[i]),
+                    value=stripped_values[i]
+                ))
+        
+        # Values seen by the numeric and enum checks; NaN cells stay NaN
+        checked = np.where(is_str, stripped_values, values)
+        
+        if field in self.NUMERIC_FIELDS:
+            replaced = stripped.str.replace(",", ".", regex=False)
+            checked = np.where(is_str, replaced.to_numpy(dtype=object), values)
+            numbers = pd.to_numeric(replaced, errors="coerce").to_numpy(dtype=float)
             
-            # Numeric validations
-            if field in ["price", "stock"]:
+            # Strings the vectorized parser rejects get a second opinion from float()
+            not_numeric = np.zeros(len(column), dtype=bool)
+            for i in np.flatnonzero(is_str & np.isnan(numbers)):
                 try:
-                    # Handle Brazilian format
-                    if isinstance(value, str):
-                        value = value.replace(",", ".")
-                    numeric_value = float(value)
-                    
-                    if "min_value" in field_rules and numeric_value < field_rules["min_value"]:
-                        errors.append(ValidationError(
-                            field=field,
-                            code=f"{field.upper()}_TOO_LOW",
-                            message=f"{field} must be at least {field_rules['min_value']}",
-                            value=value
-                        ))
-                    
-                    if "max_value" in field_rules and numeric_value > field_rules["max_value"]:
-                        errors.append(ValidationError(
-                            field=field,
-                            code=f"{field.upper()}_TOO_HIGH",
-                            message=f"{field} cannot exceed {field_rules['max_value']}",
-                            value=value
-                        ))
-                except (ValueError, TypeError):
-                    errors.append(ValidationError(
-                        field=field,
-                        code=f"{field.upper()}_NOT_NUMERIC",
-                        message=f"{field} must be numeric",
-                        value=value
-                    ))
+                    numbers[i] = float(checked[i])
+                except ValueError:
+                    not_numeric[i] = True
             
-            # Enum validation
-            if "enum_values" in field_rules:
-                enum_values = field_rules["enum_values"]
-                if not field_rules.get("case_sensitive", True):
-                    value_str = str(value).lower()
-                    enum_values = [v.lower() for v in enum_values]
-                else:
-                    value_str = str(value)
-                
-                if value_str not in enum_values:
-                    errors.append(ValidationError(
-                        field=field,
-                        code=f"{field.upper()}_INVALID_VALUE",
-                        message=f"{field} must be one of: {', '.join(field_rules['enum_values'][:5])}...",
-                        value=value
-                    ))
+            self._add_range_errors(field, spec, is_str | (is_na & ~is_none), numbers, not_numeric, checked, row_errors)
         
-        # Check custom attributes
-        custom_attrs = policy.get("custom_attributes", {})
-        for attr, attr_rules in custom_attrs.items():
-            value = row.get(attr.lower()) or row.get(attr)
-            
-            if attr_rules.get("required") and not value:
-                errors.append(ValidationError(
-                    field=attr,
-                    code=f"{attr}_REQUIRED",
-                    message=f"{attr} is required",
-                    value=value
-                ))
+        if "enum_values" in field_rules:
+            present = ~empty
+            as_text = np.where(is_str, checked, [str(v) for v in values])
+            self._add_enum_errors(field, spec, present, as_text, checked, row_errors)
+    
+    def _validate_numeric_column(self, field: str, spec: Dict, column: pd.Series, row_errors: List[List[ValidationError]]) -> None:
+        field_rules = spec["rules"]
+        # Numeric cells are never str; NaN is truthy and only 0/False are empty
+        values = column.to_numpy(dtype=object)
+        empty = self._empty_mask(column)
         
-        # Only ERROR severity blocks validation
-        is_valid = not any(e.severity == "ERROR" for e in errors)
-        return is_valid, errors
+        if field_rules.get("required"):
+            self._add_errors(row_errors, empty, values, field, *spec["errors"]["required"])
+        
+        present = ~empty
+        if field in self.NUMERIC_FIELDS:
+            numbers = column.to_numpy(dtype=float)
+            self._add_range_errors(field, spec, present, numbers, np.zeros(len(column), dtype=bool), values, row_errors)
+        
+        if "enum_values" in field_rules:
+            self._add_enum_errors(field, spec, present, [str(v) for v in values], values, row_errors)
+    
+    def _add_range_errors(
+        self, field: str, spec: Dict, present: np.ndarray, numbers: np.ndarray,
+        not_numeric: np.ndarray, values: np.ndarray, row_errors: List[List[ValidationError]]
+    ) -> None:
+        field_rules = spec["rules"]
+        texts = spec["errors"]
+        
+        # Errors are added in row order: TOO_LOW, TOO_HIGH or NOT_NUMERIC
+        parsed = present & ~not_numeric
+        checks = []
+        if "min_value" in field_rules:
+            checks.append((parsed & (numbers < field_rules["min_value"]), texts["too_low"]))
+        if "max_value" in field_rules:
+            checks.append((parsed & (numbers > field_rules["max_value"]), texts["too_high"]))
+        checks.append((present & not_numeric, texts["not_numeric"]))
+        
+        for mask, (code, message) in checks:
+            self._add_errors(row_errors, mask, values, field, code, message)
+    
+    def _add_enum_errors(
+        self, field: str, spec: Dict, present: np.ndarray, as_text: Any,
+        values: np.ndarray, row_errors: List[List[ValidationError]]
+    ) -> None:
+        field_rules = spec["rules"]
+        text = pd.Series(as_text, dtype=object)
+        if not field_rules.get("case_sensitive", True):
+            # str.lower semantics, which differ from Arrow's utf8_lower for some characters
+            text = text.str.lower()
+        
+        in_set = pc.is_in(pa.array(text.to_numpy(dtype=object), type=pa.string()), value_set=spec["enum_array"])
+        invalid = present & ~_arrow_mask(in_set)
+        self._add_errors(row_errors, invalid, values, field, *spec["errors"]["invalid_value"])
+    
+    @staticmethod
+    def _add_errors(
+        row_errors: List[List[ValidationError]], mask: np.ndarray, values: np.ndarray,
+        field: str, code: str, message: str
+    ) -> None:
+        # Error objects are only built for flagged rows
+        for i in np.flatnonzero(mask):
+            row_errors[i].append(ValidationError(field=field, code=code, message=message, value=values[i]))
+    
+    @staticmethod
+    def _column(df: pd.DataFrame, field: str) -> pd.Series:
+        if field in df.columns:
+            return df[field]
+        return pd.Series([None] * len(df), index=df.index, dtype=object)
+    
+    @staticmethod
+    def _empty_mask(column: pd.Series) -> np.ndarray:
+        """Rows where the cell is falsy, as `not value` would decide."""
+        if column.dtype.kind in "biuf":
+            return (column == 0).to_numpy()
+        if pd.api.types.infer_dtype(column, skipna=True) in ("string", "empty"):
+            return np.equal(column.to_numpy(dtype=object), None) | (column == "").to_numpy()
+        return np.fromiter((not v for v in column.to_numpy(dtype=object)), dtype=bool, count=len(column))
+
+
+def _read_csv(csv_path: Path, plan: CompiledPolicy) -> pd.DataFrame:
+    """Read the policy's columns (plus sku) as plain strings, without type inference."""
+    columns = plan.columns | {"sku"}
+    return pd.read_csv(csv_path, dtype=str, na_filter=False, usecols=lambda c: c in columns)
 
 
 def test_valid_csv():
@@ -183,20 +449,21 @@ def test_valid_csv():
         print(f"  ⚠️  CSV not found: {csv_path}")
         return
     
-    df = pd.read_csv(csv_path)
+    df = _read_csv(csv_path, engine.prepare("MLB", "MLB1743"))
     
     results = []
-    for idx, row in df.iterrows():
-        is_valid, errors = engine.validate_row(row.to_dict(), "MLB", "MLB1743")
+    skus = SimpleRuleEngine._column(df, "sku").tolist()
+    outcomes = engine.validate_frame(df, "MLB", "MLB1743")
+    for idx, sku, (is_valid, errors) in zip(df.index, skus, outcomes):
         results.append({
             "row": idx + 1,
-            "sku": row.get("sku"),
+            "sku": sku,
             "valid": is_valid,
             "errors": len(errors)
         })
         
         if not is_valid:
-            print(f"  Row {idx + 1} ({row.get('sku')}): {len(errors)} errors")
+            print(f"  Row {idx + 1} ({sku}): {len(errors)} errors")
             for e in errors[:3]:  # Show first 3 errors
                 print(f"    - {e.field}: {e.message}")
     
@@ -216,11 +483,11 @@ def test_invalid_csv():
         print(f"  ⚠️  CSV not found: {csv_path}")
         return
     
-    df = pd.read_csv(csv_path)
+    df = _read_csv(csv_path, engine.prepare("MLB", "MLB1743"))
     
     error_summary = {}
-    for idx, row in df.iterrows():
-        is_valid, errors = engine.validate_row(row.to_dict(), "MLB", "MLB1743")
+    outcomes = engine.validate_frame(df, "MLB", "MLB1743")
+    for idx, (is_valid, errors) in zip(df.index, outcomes):
         
         if errors:
             print(f"  Row {idx + 1}: {len(errors)} errors")
@@ -253,7 +520,8 @@ def test_single_row():
         "color": "Natural Titanium"
     }
     
-    is_valid, errors = engine.validate_row(valid_row, "MLB", "MLB1743")
+    plan = engine.prepare("MLB", "MLB1743")
+    is_valid, errors = engine.validate_row_plan(valid_row, plan)
     print(f"  Valid row: {is_valid} (errors: {len(errors)})")
     
     # Invalid row
@@ -266,7 +534,7 @@ def test_single_row():
         "condition": "broken"
     }
     
-    is_valid, errors = engine.validate_row(invalid_row, "MLB", "MLB1743")
+    is_valid, errors = engine.validate_row_plan(invalid_row, plan)
     print(f"  Invalid row: {is_valid} (errors: {len(errors)})")
     for e in errors:
         print(f"    - {e.field}: {e.message}")
@@ -284,7 +552,7 @@ def main():
         
         # Load and show policy summary
         with open(policy_file) as f:
-            policy = yaml.safe_load(f)
+            policy = yaml.load(f, Loader=_YamlLoader)
         
         print(f"  Version: {policy.get('version')}")
         print(f"  Category: {policy.get('category_name')}")
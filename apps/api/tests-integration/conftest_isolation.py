@@ -4,9 +4,9 @@ Unit tests não devem depender de recursos externos como banco de dados.
 """
 import os
 import pytest
+from types import SimpleNamespace
 from unittest.mock import MagicMock, AsyncMock, patch
 from typing import Generator, Any
-import asyncio
 
 # Marcar testes que precisam de banco de dados
 pytest.mark.requires_db = pytest.mark.skipif(
@@ -91,23 +91,34 @@ def mock_async_db_session():
     
     return session
 
+def _async_returning(value):
+    """
+    Cria uma função assíncrona que ignora os argumentos e devolve ``value``.
+    """
+    async def _stub(*args, **kwargs):
+        return value
+    return _stub
+
 # Mock de repositório genérico
 @pytest.fixture
 def mock_repository():
     """
-    Fornece um repositório mockado genérico.
-    """
-    repo = MagicMock()
-    repo.get = AsyncMock(return_value=None)
-    repo.get_by_id = AsyncMock(return_value=None)
-    repo.get_all = AsyncMock(return_value=[])
-    repo.create = AsyncMock(return_value=MagicMock(id=1))
-    repo.update = AsyncMock(return_value=MagicMock(id=1))
-    repo.delete = AsyncMock(return_value=True)
-    repo.exists = AsyncMock(return_value=False)
-    repo.count = AsyncMock(return_value=0)
+    Fornece um repositório stub genérico com corrotinas de retorno fixo.
     
-    return repo
+    Corrotinas simples no lugar de AsyncMock, como no mock_redis_client.
+    Testes que precisam contar chamadas podem envolver o método com
+    MagicMock(wraps=...).
+    """
+    return SimpleNamespace(
+        get=_async_returning(None),
+        get_by_id=_async_returning(None),
+        get_all=_async_returning([]),
+        create=_async_returning(SimpleNamespace(id=1)),
+        update=_async_returning(SimpleNamespace(id=1)),
+        delete=_async_returning(True),
+        exists=_async_returning(False),
+        count=_async_returning(0),
+    )
 
 # Fixture para isolar testes de Redis
 @pytest.fixture(autouse=True, scope="function")
@@ -135,23 +146,26 @@ def prevent_redis_access(request):
 @pytest.fixture
 def mock_redis_client():
     """
-    Fornece um cliente Redis mockado.
-    """
-    client = MagicMock()
-    client.get = MagicMock(return_value=None)
-    client.set = MagicMock(return_value=True)
-    client.delete = MagicMock(return_value=1)
-    client.exists = MagicMock(return_value=0)
-    client.expire = MagicMock(return_value=True)
-    client.ttl = MagicMock(return_value=-2)
-    client.incr = MagicMock(return_value=1)
-    client.decr = MagicMock(return_value=0)
-    client.hget = MagicMock(return_value=None)
-    client.hset = MagicMock(return_value=1)
-    client.hdel = MagicMock(return_value=1)
-    client.hgetall = MagicMock(return_value={})
+    Fornece um cliente Redis stub com valores de retorno fixos.
     
-    return client
+    Usa SimpleNamespace em vez de MagicMock: só os retornos importam, e
+    montar um namespace custa bem menos que uma árvore de mocks. Testes que
+    precisam verificar chamadas devem usar MagicMock diretamente.
+    """
+    return SimpleNamespace(
+        get=lambda *args, **kwargs: None,
+        set=lambda *args, **kwargs: True,
+        delete=lambda *args, **kwargs: 1,
+        exists=lambda *args, **kwargs: 0,
+        expire=lambda *args, **kwargs: True,
+        ttl=lambda *args, **kwargs: -2,
+        incr=lambda *args, **kwargs: 1,
+        decr=lambda *args, **kwargs: 0,
+        hget=lambda *args, **kwargs: None,
+        hset=lambda *args, **kwargs: 1,
+        hdel=lambda *args, **kwargs: 1,
+        hgetall=lambda *args, **kwargs: {},
+    )
 
 # Fixture para isolar testes de APIs externas
 @pytest.fixture(autouse=True, scope="function")
@@ -213,37 +227,3 @@ def temp_directory(tmp_path):
     Fornece um diretório temporário isolado para testes.
     """
     return tmp_path
-
-# Configuração para testes assíncronos
-@pytest.fixture
-def event_loop():
-    """
-    Cria um event loop para testes assíncronos.
-    """
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
-
-# Marcadores customizados para categorizar testes
-def pytest_configure(config):
-    """
-    Registra marcadores customizados.
-    """
-    config.addinivalue_line(
-        "markers", "unit: marca testes como unit tests (isolados)"
-    )
-    config.addinivalue_line(
-        "markers", "integration: marca testes que precisam de recursos externos"
-    )
-    config.addinivalue_line(
-        "markers", "requires_db: marca testes que precisam de banco de dados"
-    )
-    config.addinivalue_line(
-        "markers", "requires_redis: marca testes que precisam de Redis"
-    )
-    config.addinivalue_line(
-        "markers", "external_api: marca testes que chamam APIs externas"
-    )
-    config.addinivalue_line(
-        "markers", "slow: marca testes lentos que podem ser pulados em CI"
-    )
\ No newline at end of file
@@ -3,7 +3,9 @@ Fixtures de respostas do MELI para testes offline.
 Evita chamadas reais à API e garante testes determinísticos.
 """
 from datetime import datetime, timezone
+import copy
 import json
+import random
 
 # Resposta de sucesso para produto
 PRODUCT_SUCCESS_RESPONSE = {
@@ -165,70 +167,64 @@ TIMEOUT_RESPONSE = {
     "_delay_seconds": 35
 }
 
+# Respostas por (endpoint_type, status), montadas uma única vez
+_RESPONSES = {
+    ("product", "success"): PRODUCT_SUCCESS_RESPONSE,
+    ("product", "not_found"): NOT_FOUND_RESPONSE,
+    ("product", "rate_limit"): RATE_LIMIT_RESPONSE,
+    ("product", "error"): INTERNAL_ERROR_RESPONSE,
+    ("product", "timeout"): TIMEOUT_RESPONSE,
+    ("category", "success"): CATEGORY_RESPONSE,
+    ("category", "not_found"): NOT_FOUND_RESPONSE,
+    ("category", "error"): INTERNAL_ERROR_RESPONSE,
+    ("search", "success"): SEARCH_RESPONSE,
+    ("search", "error"): INTERNAL_ERROR_RESPONSE,
+    ("search", "rate_limit"): RATE_LIMIT_RESPONSE,
+    ("user", "success"): USER_RESPONSE,
+    ("user", "not_found"): NOT_FOUND_RESPONSE,
+    ("user", "error"): INTERNAL_ERROR_RESPONSE,
+    ("order", "success"): ORDER_RESPONSE,
+    ("order", "not_found"): NOT_FOUND_RESPONSE,
+    ("order", "error"): INTERNAL_ERROR_RESPONSE,
+}
+
 def get_mock_response(endpoint_type, status="success"):
     """
-    Retorna uma resposta mock baseada no tipo de endpoint e status.
+    Retorna uma cópia profunda de uma resposta mock baseada no tipo de
+    endpoint e status.
+    
+    As constantes do módulo são compartilhadas entre testes; a cópia
+    garante que um teste não altere a resposta vista pelos outros.
     
     Args:
         endpoint_type: product, category, search, user, order
         status: success, not_found, rate_limit, error, timeout
     """
-    responses = {
-        "product": {
-            "success": PRODUCT_SUCCESS_RESPONSE,
-            "not_found": NOT_FOUND_RESPONSE,
-            "rate_limit": RATE_LIMIT_RESPONSE,
-            "error": INTERNAL_ERROR_RESPONSE,
-            "timeout": TIMEOUT_RESPONSE
-        },
-        "category": {
-            "success": CATEGORY_RESPONSE,
-            "not_found": NOT_FOUND_RESPONSE,
-            "error": INTERNAL_ERROR_RESPONSE
-        },
-        "search": {
-            "success": SEARCH_RESPONSE,
-            "error": INTERNAL_ERROR_RESPONSE,
-            "rate_limit": RATE_LIMIT_RESPONSE
-        },
-        "user": {
-            "success": USER_RESPONSE,
-            "not_found": NOT_FOUND_RESPONSE,
-            "error": INTERNAL_ERROR_RESPONSE
-        },
-        "order": {
-            "success": ORDER_RESPONSE,
-            "not_found": NOT_FOUND_RESPONSE,
-            "error": INTERNAL_ERROR_RESPONSE
-        }
-    }
-    
-    return responses.get(endpoint_type, {}).get(status, INTERNAL_ERROR_RESPONSE)
+    return copy.deepcopy(_RESPONSES.get((endpoint_type, status), INTERNAL_ERROR_RESPONSE))
 
 def generate_batch_responses(endpoint_type, count=10, success_rate=0.9):
     """
     Gera uma lista de respostas para simular batch processing.
     
+    Cada resposta é uma cópia independente; as de sucesso têm IDs distintos.
+    
     Args:
         endpoint_type: Tipo de endpoint
         count: Número de respostas
         success_rate: Taxa de sucesso (0.0 a 1.0)
     """
-    import random
-    responses = []
+    error_types = ["not_found", "rate_limit", "error"]
+    errors = random.choices(error_types, k=count)
     
+    responses = []
     for i in range(count):
-        if random.random() < success_rate:
-            response = get_mock_response(endpoint_type, "success")
+        if random.random() >= success_rate:
+            responses.append(get_mock_response(endpoint_type, errors[i]))
+            continue
+        response = get_mock_response(endpoint_type, "success")
+        if "id" in response:
             # Variar o ID para cada resposta
-            if "id" in response:
-                response = response.copy()
-                response["id"] = f"{response['id'][:3]}{1000000000 + i}"
-        else:
-            # Distribuir erros aleatoriamente
-            error_types = ["not_found", "rate_limit", "error"]
-            response = get_mock_response(endpoint_type, random.choice(error_types))
-            
+            response["id"] = f"{response['id'][:3]}{1000000000 + i}"
         responses.append(response)
     
     return responses
\ No newline at end of file
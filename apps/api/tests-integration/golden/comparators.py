@@ -8,6 +8,17 @@ from dataclasses import dataclass
 from pathlib import Path
 
 
+# One row of the cell differences table in ComparisonResult.to_html
+_CELL_ROW_TEMPLATE = """
+                <tr class="mismatch">
+                    <td>{row}</td>
+                    <td>{column}</td>
+                    <td>{expected}</td>
+                    <td>{actual}</td>
+                </tr>
+                """
+
+
 @dataclass
 class ComparisonResult:
     """Result of a comparison operation."""
@@ -44,8 +55,11 @@ class ComparisonResult:
             </div>
         """
         
+        # Collect fragments and join once instead of growing one string
+        parts = [html]
         if self.diff_details and 'cell_differences' in self.diff_details:
-            html += """
+            cell_differences = self.diff_details['cell_differences']
+            parts.append("""
             <h2>Cell Differences</h2>
             <table>
                 <tr>
@@ -54,23 +68,53 @@ class ComparisonResult:
                     <th>Expected</th>
                     <th>Actual</th>
                 </tr>
-            """
-            for diff in self.diff_details['cell_differences'][:100]:  # Limit to 100
-                html += f"""
-                <tr class="mismatch">
-                    <td>{diff['row']}</td>
-                    <td>{diff['column']}</td>
-                    <td>{diff['expected']}</td>
-                    <td>{diff['actual']}</td>
-                </tr>
-                """
-            html += "</table>"
+            """)
+            row_template = _CELL_ROW_TEMPLATE.format
+            parts.extend(
+                row_template(**diff) for diff in cell_differences[:100]  # Limit to 100
+            )
+            parts.append("</table>")
             
-            if len(self.diff_details['cell_differences']) > 100:
-                html += f"<p>... and {len(self.diff_details['cell_differences']) - 100} more differences</p>"
+            if len(cell_differences) > 100:
+                parts.append(f"<p>... and {len(cell_differences) - 100} more differences</p>")
+            
+            if self.diff_details.get('truncated_count'):
+                parts.append(f"<p>... {self.diff_details['truncated_count']}+ more (truncated at cap)</p>")
         
-        html += "</body></html>"
-        return html
+        parts.append("</body></html>")
+        return "".join(parts)
+
+
+def compare_columns(
+    actual_columns: pd.Index,
+    expected_columns: pd.Index,
+) -> ComparisonResult:
+    """
+    Compare the column labels of two DataFrames, including their order.
+    
+    Args:
+        actual_columns: Columns of the actual output
+        expected_columns: Columns of the expected output
+    
+    Returns:
+        ComparisonResult listing missing and extra columns
+    """
+    if not actual_columns.equals(expected_columns):
+        missing = set(expected_columns) - set(actual_columns)
+        extra = set(actual_columns) - set(expected_columns)
+        return ComparisonResult(
+            passed=False,
+            diff_summary=f"Column mismatch. Missing: {missing}, Extra: {extra}",
+            diff_details={
+                'missing_columns': list(missing),
+                'extra_columns': list(extra),
+            }
+        )
+    
+    return ComparisonResult(
+        passed=True,
+        diff_summary="Columns match"
+    )
 
 
 def compare_csv(
@@ -78,6 +122,7 @@ def compare_csv(
     expected_df: pd.DataFrame,
     float_tolerance: float = 1e-6,
     ignore_columns: Optional[List[str]] = None,
+    max_diffs: int = 500,
 ) -> ComparisonResult:
     """
     Compare two DataFrames with tolerance for floats.
@@ -87,6 +132,7 @@ def compare_csv(
         expected_df: Expected output DataFrame
         float_tolerance: Tolerance for float comparison
         ignore_columns: Columns to ignore in comparison
+        max_diffs: Stop collecting cell differences after this many
     
     Returns:
         ComparisonResult with detailed differences
@@ -112,55 +158,98 @@ def compare_csv(
         )
     
     # Check columns
-    if not actual_df.columns.equals(expected_df.columns):
-        missing = set(expected_df.columns) - set(actual_df.columns)
-        extra = set(actual_df.columns) - set(expected_df.columns)
+    columns_result = compare_columns(actual_df.columns, expected_df.columns)
+    if not columns_result.passed:
+        return columns_result
+    
+    # Fast path: identical frames (NaN equal to NaN) need no cell walk
+    if actual_df.equals(expected_df):
         return ComparisonResult(
-            passed=False,
-            diff_summary=f"Column mismatch. Missing: {missing}, Extra: {extra}",
-            diff_details={
-                'missing_columns': list(missing),
-                'extra_columns': list(extra),
-            }
+            passed=True,
+            diff_summary="All values match within tolerance"
         )
     
-    # Compare values
+    # Compare values one column at a time with vectorized masks
     differences = []
+    truncated_count = 0
+    row_labels = actual_df.index
+    
+    # Numeric-ness is a column property: decide it once per column
+    float_cols = (
+        set(actual_df.select_dtypes(include='floating').columns)
+        & set(expected_df.select_dtypes(include='floating').columns)
+    )
+    object_cols = (
+        set(actual_df.select_dtypes(include='object').columns)
+        | set(expected_df.select_dtypes(include='object').columns)
+    )
+    
     for col in actual_df.columns:
-        for idx in actual_df.index:
-            actual_val = actual_df.loc[idx, col]
-            expected_val = expected_df.loc[idx, col]
-            
-            # Handle NaN comparison
-            if pd.isna(actual_val) and pd.isna(expected_val):
-                continue
-            elif pd.isna(actual_val) or pd.isna(expected_val):
-                differences.append({
-                    'row': idx,
-                    'column': col,
-                    'expected': expected_val,
-                    'actual': actual_val,
-                })
+        actual_col = actual_df[col]
+        expected_col = expected_df[col]
+        if actual_col.equals(expected_col):
+            continue
+        # Only object columns can hold floats outside a float dtype
+        recheck_floats = col in object_cols
+        is_float_col = col in float_cols
+        
+        if is_float_col:
+            actual_vals = actual_col.to_numpy(dtype=float, na_value=np.nan)
+            expected_vals = expected_col.to_numpy(dtype=float, na_value=np.nan)
+        else:
+            actual_vals = actual_col.to_numpy()
+            expected_vals = expected_col.to_numpy()
+        
+        # NaN masks once per column: both NaN is equal, one NaN is a mismatch,
+        # and only cells with two values get a value comparison
+        actual_na = pd.isna(actual_vals)
+        expected_na = pd.isna(expected_vals)
+        mismatch = actual_na ^ expected_na
+        comparable = ~(actual_na | expected_na)
+        if comparable.any():
+            actual_cmp = actual_vals[comparable]
+            expected_cmp = expected_vals[comparable]
+            if is_float_col:
+                # Float comparison with tolerance
+                mismatch[comparable] = ~np.isclose(actual_cmp, expected_cmp, atol=float_tolerance)
+            else:
+                # Exact comparison for other types
+                mismatch[comparable] = np.asarray(actual_cmp != expected_cmp, dtype=bool)
+        
+        # Only mismatching cells are inspected one by one
+        positions = np.nonzero(mismatch)[0]
+        for i, pos in enumerate(positions):
+            if len(differences) >= max_diffs:
+                # Cap reached: only count what is left in this column
+                truncated_count = len(positions) - i
+                break
+            actual_val = actual_vals[pos]
+            expected_val = expected_vals[pos]
+            diff = {
+                'row': row_labels[pos],
+                'column': col,
+                'expected': expected_val,
+                'actual': actual_val,
+            }
+            if not comparable[pos]:
+                # One side is missing: no numeric distance to report
+                differences.append(diff)
                 continue
-            
-            # Float comparison with tolerance
-            if isinstance(actual_val, (float, np.floating)) and isinstance(expected_val, (float, np.floating)):
-                if not np.isclose(actual_val, expected_val, atol=float_tolerance):
-                    differences.append({
-                        'row': idx,
-                        'column': col,
-                        'expected': expected_val,
-                        'actual': actual_val,
-                        'diff': abs(actual_val - expected_val),
-                    })
-            # Exact comparison for other types
-            elif actual_val != expected_val:
-                differences.append({
-                    'row': idx,
-                    'column': col,
-                    'expected': expected_val,
-                    'actual': actual_val,
-                })
+            if is_float_col:
+                diff['diff'] = abs(actual_val - expected_val)
+            elif (
+                recheck_floats
+                and isinstance(actual_val, (float, np.floating))
+                and isinstance(expected_val, (float, np.floating))
+            ):
+                # Floats in object columns still get the tolerance
+                if np.isclose(actual_val, expected_val, atol=float_tolerance):
+                    continue
+                diff['diff'] = abs(actual_val - expected_val)
+            differences.append(diff)
+        
+        if truncated_count:
+            break
     
     if differences:
         summary = f"Found {len(differences)} cell differences"
@@ -172,11 +261,17 @@ def compare_csv(
             for d in differences[:5]:
                 summary += f"\n  [{d['row']}, {d['column']}]: {d['expected']} != {d['actual']}"
             summary += f"\n  ... and {len(differences) - 5} more"
+        if truncated_count:
+            summary += f"\n  ... {truncated_count}+ more (truncated at cap)"
+        
+        diff_details = {'cell_differences': differences}
+        if truncated_count:
+            diff_details['truncated_count'] = truncated_count
         
         return ComparisonResult(
             passed=False,
             diff_summary=summary,
-            diff_details={'cell_differences': differences}
+            diff_details=diff_details
         )
     
     return ComparisonResult(
@@ -185,6 +280,26 @@ def compare_csv(
     )
 
 
+# Stack marker closing a container in compare_json
+_SUBTREE_END = object()
+
+
+def _format_path(path) -> str:
+    """
+    Render a compare_json path.
+    
+    Paths are kept as (parent, separator, key) links while walking and only
+    joined into strings like "root.items[0].price" when a difference is
+    recorded.
+    """
+    parts = []
+    while isinstance(path, tuple):
+        path, separator, key = path
+        parts.append(f".{key}" if separator == "." else f"[{key}]")
+    parts.append(path)
+    return "".join(reversed(parts))
+
+
 def compare_json(
     actual: dict,
     expected: dict,
@@ -205,52 +320,94 @@ def compare_json(
     Returns:
         ComparisonResult with differences
     """
-    ignore_keys = ignore_keys or []
+    ignore_set = frozenset(ignore_keys or ())
     differences = []
+    # Containers already compared, keyed by identity: (path, start, end) of
+    # the differences they produced. Parsed JSON is not mutated while we walk.
+    seen: Dict[Tuple[int, int], Tuple[Any, int, int]] = {}
     
-    def _compare(actual_val, expected_val, current_path):
+    # Walk both structures with an explicit stack instead of recursion.
+    # Children are pushed in reverse so they are visited in document order.
+    stack = [(actual, expected, path or "root")]
+    while stack:
+        actual_val, expected_val, current_path = stack.pop()
+        
+        if actual_val is _SUBTREE_END:
+            # All children of a container are done; remember its differences
+            pair_key, (subtree_path, start) = expected_val, current_path
+            seen[pair_key] = (subtree_path, start, len(differences))
+            continue
+        
+        if isinstance(actual_val, (dict, list)):
+            pair_key = (id(actual_val), id(expected_val))
+            done = seen.get(pair_key)
+            if done is not None:
+                # Shared subtree: replay its differences under this path
+                subtree_path, start, end = done
+                if start < end:
+                    old_prefix = len(_format_path(subtree_path))
+                    new_prefix = _format_path(current_path)
+                    differences.extend(
+                        {**d, 'path': new_prefix + d['path'][old_prefix:]}
+                        for d in differences[start:end]
+                    )
+                continue
+            stack.append((_SUBTREE_END, pair_key, (current_path, len(differences))))
+        
         if isinstance(actual_val, dict) and isinstance(expected_val, dict):
-            # Compare dictionaries
-            actual_keys = set(actual_val.keys()) - set(ignore_keys)
-            expected_keys = set(expected_val.keys()) - set(ignore_keys)
-            
-            missing = expected_keys - actual_keys
-            extra = actual_keys - expected_keys
+            # Compare dictionaries; keys are checked against the dicts
+            # directly, in document order, without building key sets
+            missing = [
+                key for key in expected_val
+                if key not in actual_val and key not in ignore_set
+            ]
+            extra = [
+                key for key in actual_val
+                if key not in expected_val and key not in ignore_set
+            ]
             
             if missing:
                 differences.append({
-                    'path': current_path,
+                    'path': _format_path(current_path),
                     'type': 'missing_keys',
-                    'keys': list(missing),
+                    'keys': missing,
                 })
             if extra:
                 differences.append({
-                    'path': current_path,
+                    'path': _format_path(current_path),
                     'type': 'extra_keys',
-                    'keys': list(extra),
+                    'keys': extra,
                 })
             
-            for key in actual_keys & expected_keys:
-                _compare(actual_val[key], expected_val[key], f"{current_path}.{key}")
+            common_keys = [
+                key for key in actual_val
+                if key in expected_val and key not in ignore_set
+            ]
+            stack.extend(
+                (actual_val[key], expected_val[key], (current_path, ".", key))
+                for key in reversed(common_keys)
+            )
                 
         elif isinstance(actual_val, list) and isinstance(expected_val, list):
             # Compare lists
             if len(actual_val) != len(expected_val):
                 differences.append({
-                    'path': current_path,
+                    'path': _format_path(current_path),
                     'type': 'list_length',
                     'expected': len(expected_val),
                     'actual': len(actual_val),
                 })
             else:
-                for i, (a, e) in enumerate(zip(actual_val, expected_val)):
-                    _compare(a, e, f"{current_path}[{i}]")
+                stack.extend(
+                    (actual_val[i], expected_val[i], (current_path, "[", i))
+                    for i in reversed(range(len(actual_val)))
+                )
                     
         elif isinstance(actual_val, float) and isinstance(expected_val, float):
             # Float comparison with tolerance
             if not np.isclose(actual_val, expected_val, atol=float_tolerance):
                 differences.append({
-                    'path': current_path,
+                    'path': _format_path(current_path),
                     'type': 'value',
                     'expected': expected_val,
                     'actual': actual_val,
@@ -259,14 +416,12 @@ def compare_json(
             # Exact comparison
             if actual_val != expected_val:
                 differences.append({
-                    'path': current_path,
+                    'path': _format_path(current_path),
                     'type': 'value',
                     'expected': expected_val,
                     'actual': actual_val,
                 })
     
-    _compare(actual, expected, path or "root")
-    
     if differences:
         summary = f"Found {len(differences)} differences in JSON"
         for d in differences[:5]:
@@ -1,6 +1,6 @@
 """Golden test configuration schema."""
 
-from typing import List, Optional
+from typing import List, Literal, Optional
 from pydantic import BaseModel, Field
 
 
@@ -32,6 +32,10 @@ class GoldenTestConfig(BaseModel):
     
     # Streaming
     chunk_size: Optional[int] = None  # None = load entire file
+    # Parser for whole-file input reads. "pyarrow" is multi-threaded but
+    # infers dates/timestamps and returns None for missing text, so only
+    # opt in for cases whose expected output was generated with it.
+    csv_engine: Literal["c", "pyarrow"] = "c"
     
     class Config:
         """Pydantic config."""
@@ -9,14 +9,6 @@ import shutil
 from .golden_runner import run_golden_case, discover_cases, load_spec
 
 
-def pytest_configure(config):
-    """Register custom markers."""
-    config.addinivalue_line("markers", "golden: mark test as golden test")
-    config.addinivalue_line("markers", "mercado_livre: mark test for Mercado Livre")
-    config.addinivalue_line("markers", "shopee: mark test for Shopee")
-    config.addinivalue_line("markers", "amazon: mark test for Amazon")
-
-
 @pytest.fixture
 def golden_case():
     """Fixture for running a golden test case."""
@@ -43,23 +35,36 @@ def tmp_outdir():
     shutil.rmtree(tmpdir, ignore_errors=True)
 
 
+# Path substring -> marker, checked in order; first match wins
+DIR_MARKERS = (
+    ('mercado_livre', pytest.mark.mercado_livre),
+    ('shopee', pytest.mark.shopee),
+    ('amazon', pytest.mark.amazon),
+)
+
+
 def pytest_collection_modifyitems(items):
     """Auto-mark tests based on their path."""
+    # Items from the same file share markers; resolve each path only once
+    markers_by_path = {}
     for item in items:
-        # Get the test file path
-        test_path = str(item.fspath)
-        
-        # Auto-add golden marker if in golden directory
-        if 'tests/golden' in test_path:
-            item.add_marker(pytest.mark.golden)
-        
-        # Auto-add marketplace markers based on path
-        if 'mercado_livre' in test_path:
-            item.add_marker(pytest.mark.mercado_livre)
-        elif 'shopee' in test_path:
-            item.add_marker(pytest.mark.shopee)
-        elif 'amazon' in test_path:
-            item.add_marker(pytest.mark.amazon)
+        fspath = item.fspath
+        markers = markers_by_path.get(fspath)
+        if markers is None:
+            test_path = str(fspath)
+            markers = []
+            # Auto-add golden marker if in golden directory
+            if 'tests/golden' in test_path:
+                markers.append(pytest.mark.golden)
+            # Auto-add marketplace marker based on path
+            for sub, mark in DIR_MARKERS:
+                if sub in test_path:
+                    markers.append(mark)
+                    break
+            markers_by_path[fspath] = markers
+
+        for mark in markers:
+            item.add_marker(mark)
 
 
 def pytest_generate_tests(metafunc):
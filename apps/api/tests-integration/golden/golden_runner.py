@@ -1,8 +1,11 @@
 """Golden test runner for ValidaHub pipeline."""
 
+import os
 import pandas as pd
 import json
+from collections import deque
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any, Tuple
 
@@ -12,31 +15,85 @@ from .normalizers import (
     normalize_json,
     normalize_numeric_columns,
 )
-from .comparators import compare_csv, compare_json, ComparisonResult
+from .comparators import compare_columns, compare_csv, compare_json, ComparisonResult
+
+# libyaml-backed loader when available, pure-Python SafeLoader otherwise
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# orjson parses reports in C when installed; stdlib json otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _read_json(path: Path) -> Any:
+    """Load a JSON file, using orjson when available."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            data = f.read()
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # json.dump writes NaN/Infinity, which orjson does not accept
+            return json.loads(data)
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """
+    Write data as indented JSON.
+    
+    Always stdlib json: reports carry numpy scalars, NaN and non-str keys,
+    which orjson rejects or writes differently, and these files become goldens.
+    """
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+
+
+@lru_cache(maxsize=None)
+def _load_spec_data(config_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a config.yaml; cached per file path and modification time."""
+    with open(config_path, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader)
 
 
 def load_spec(config_path: str) -> GoldenTestConfig:
     """
     Load and validate test specification from YAML.
     
+    The parsed YAML is cached until the file changes, so discovery, updates
+    and test runs that load the same config only parse it once.
+    
     Args:
         config_path: Path to config.yaml file
     
     Returns:
         Validated GoldenTestConfig
     """
-    with open(config_path, 'r') as f:
-        data = yaml.safe_load(f)
+    path = Path(config_path).resolve()
+    data = _load_spec_data(str(path), path.stat().st_mtime_ns)
     return GoldenTestConfig(**data)
 
 
-def read_csv_stream(path: str, chunk_size: Optional[int] = None, **kwargs):
+def read_csv_stream(
+    path: str,
+    chunk_size: Optional[int] = None,
+    engine: str = "c",
+    **kwargs,
+):
     """
     Read CSV file, optionally in chunks for streaming.
     
     Args:
         path: Path to CSV file
         chunk_size: Number of rows per chunk (None for full file)
+        engine: pandas parser engine for whole-file reads; chunked reads
+            always use the C engine since pyarrow has no ``chunksize``
         **kwargs: Additional pandas read_csv arguments
     
     Yields:
@@ -46,7 +103,35 @@ def read_csv_stream(path: str, chunk_size: Optional[int] = None, **kwargs):
         for chunk in pd.read_csv(path, chunksize=chunk_size, **kwargs):
             yield chunk
     else:
-        yield pd.read_csv(path, **kwargs)
+        yield pd.read_csv(path, engine=engine, **kwargs)
+
+
+@lru_cache(maxsize=32)
+def _get_pipelines(marketplace_enum, category: str) -> Tuple[Any, Any]:
+    """
+    Build the validation and correction pipelines for a marketplace/category.
+    
+    Cached so chunked cases load rules and compile them once, not per chunk.
+    
+    Args:
+        marketplace_enum: Marketplace enum member
+        category: Upper-cased category name
+    
+    Returns:
+        Tuple of (ValidationPipeline, CorrectionPipeline)
+    """
+    from apps.api.src.core.pipeline.validation_pipeline import ValidationPipeline
+    from apps.api.src.core.pipeline.correction_pipeline import CorrectionPipeline
+    
+    validation_pipeline = ValidationPipeline(
+        marketplace=marketplace_enum,
+        category=category,
+    )
+    correction_pipeline = CorrectionPipeline(
+        marketplace=marketplace_enum,
+        category=category,
+    )
+    return validation_pipeline, correction_pipeline
 
 
 def run_pipeline(
@@ -67,8 +152,6 @@ def run_pipeline(
     """
     # Import pipeline components
     try:
-        from apps.api.src.core.pipeline.validation_pipeline import ValidationPipeline
-        from apps.api.src.core.pipeline.correction_pipeline import CorrectionPipeline
         from apps.api.src.models.marketplace import Marketplace
         
         # Map string to enum
@@ -81,18 +164,14 @@ def run_pipeline(
         if not marketplace_enum:
             raise ValueError(f"Unknown marketplace: {marketplace}")
         
-        # Run validation
-        validation_pipeline = ValidationPipeline(
-            marketplace=marketplace_enum,
-            category=category.upper(),
+        validation_pipeline, correction_pipeline = _get_pipelines(
+            marketplace_enum, category.upper()
         )
+        
+        # Run validation
         validation_result = validation_pipeline.validate(input_df)
         
         # Run correction
-        correction_pipeline = CorrectionPipeline(
-            marketplace=marketplace_enum,
-            category=category.upper(),
-        )
         corrected_df = correction_pipeline.correct(input_df, validation_result.errors)
         
         # Build report
@@ -164,11 +243,12 @@ def run_golden_case(
     
     # Process in chunks if specified
     all_outputs = []
-    all_reports = []
+    actual_report = {}
     
     for chunk_df in read_csv_stream(
         input_path,
         chunk_size=spec.chunk_size,
+        engine=spec.csv_engine,
         sep=spec.separator,
         encoding=spec.encoding,
     ):
@@ -176,16 +256,18 @@ def run_golden_case(
         if spec.decimal != ".":
             chunk_df = normalize_numeric_columns(chunk_df, spec.decimal)
         
-        # Run pipeline
-        output_df, report = run_pipeline(chunk_df, marketplace, category)
+        # Run pipeline (reports simplified - just keep the last one for now)
+        output_df, actual_report = run_pipeline(chunk_df, marketplace, category)
         all_outputs.append(output_df)
-        all_reports.append(report)
     
-    # Combine results
-    actual_output = pd.concat(all_outputs, ignore_index=True)
-    
-    # Combine reports (simplified - just take last one for now)
-    actual_report = all_reports[-1] if all_reports else {}
+    # Combine results; a single chunk is used as is, otherwise the chunk
+    # list is released right after concat so chunks are not kept alive
+    # through normalization
+    if len(all_outputs) == 1:
+        actual_output = all_outputs[0].reset_index(drop=True)
+    else:
+        actual_output = pd.concat(all_outputs, ignore_index=True, copy=False)
+    del all_outputs
     
     # Normalize actual output
     actual_output = normalize_dataframe(
@@ -200,30 +282,44 @@ def run_golden_case(
     # Load and normalize expected output
     expected_output_path = case_path / "expected_output.csv"
     if expected_output_path.exists():
-        expected_output = pd.read_csv(
+        # Check the header first so a column mismatch does not need the
+        # whole expected file to be read and normalized
+        expected_columns = pd.read_csv(
             expected_output_path,
             sep=spec.separator,
             encoding=spec.encoding,
+            nrows=0,
+        ).columns
+        csv_result = compare_columns(
+            actual_output.columns.drop(spec.ignore_columns_in_diff, errors='ignore'),
+            expected_columns.drop(spec.ignore_columns_in_diff, errors='ignore'),
         )
-        if spec.decimal != ".":
-            expected_output = normalize_numeric_columns(expected_output, spec.decimal)
         
-        expected_output = normalize_dataframe(
-            expected_output,
-            key_columns=spec.key_columns,
-            sort_by=spec.sort_by,
-            trim_whitespace=spec.trim_whitespace,
-            casefold_text=spec.casefold_text,
-            normalize_floats=spec.normalize_floats,
-        )
-        
-        # Compare CSV outputs
-        csv_result = compare_csv(
-            actual_output,
-            expected_output,
-            float_tolerance=spec.float_tolerance,
-            ignore_columns=spec.ignore_columns_in_diff,
-        )
+        if csv_result.passed:
+            expected_output = pd.read_csv(
+                expected_output_path,
+                sep=spec.separator,
+                encoding=spec.encoding,
+            )
+            if spec.decimal != ".":
+                expected_output = normalize_numeric_columns(expected_output, spec.decimal)
+            
+            expected_output = normalize_dataframe(
+                expected_output,
+                key_columns=spec.key_columns,
+                sort_by=spec.sort_by,
+                trim_whitespace=spec.trim_whitespace,
+                casefold_text=spec.casefold_text,
+                normalize_floats=spec.normalize_floats,
+            )
+            
+            # Compare CSV outputs
+            csv_result = compare_csv(
+                actual_output,
+                expected_output,
+                float_tolerance=spec.float_tolerance,
+                ignore_columns=spec.ignore_columns_in_diff,
+            )
         
         if not csv_result.passed:
             if save_artifacts:
@@ -237,8 +333,7 @@ def run_golden_case(
     # Load and compare report if exists
     expected_report_path = case_path / "expected_report.json"
     if expected_report_path.exists():
-        with open(expected_report_path, 'r') as f:
-            expected_report = json.load(f)
+        expected_report = _read_json(expected_report_path)
         
         # Normalize reports
         actual_report = normalize_json(
@@ -262,8 +357,7 @@ def run_golden_case(
             if save_artifacts:
                 artifacts_dir = case_path / "artifacts"
                 artifacts_dir.mkdir(exist_ok=True)
-                with open(artifacts_dir / "actual_report.json", 'w') as f:
-                    json.dump(actual_report, f, indent=2)
+                _write_json(artifacts_dir / "actual_report.json", actual_report)
                 with open(artifacts_dir / "report_diff.html", 'w') as f:
                     f.write(report_result.to_html())
             return report_result
@@ -284,11 +378,23 @@ def discover_cases(root_dir: str = "tests/golden") -> list:
     Returns:
         List of case directories
     """
+    # Breadth-first walk with os.scandir: directory entries carry their
+    # type, so only candidate case directories need an extra stat
     cases = []
-    root_path = Path(root_dir)
-    
-    for case_dir in root_path.glob("**/case_*"):
-        if (case_dir / "input.csv").exists():
-            cases.append(str(case_dir))
+    pending = deque([str(Path(root_dir))])
+    while pending:
+        directory = pending.popleft()
+        try:
+            with os.scandir(directory) as it:
+                subdirs = [entry for entry in it if entry.is_dir()]
+        except OSError:
+            continue
+        
+        for entry in subdirs:
+            if entry.name.startswith("case_") and os.path.exists(
+                os.path.join(entry.path, "input.csv")
+            ):
+                cases.append(entry.path)
+            pending.append(entry.path)
     
     return sorted(cases)
\ No newline at end of file
@@ -2,6 +2,7 @@
 
 import pandas as pd
 import numpy as np
+from pandas.api.types import infer_dtype
 from typing import List, Optional
 import locale
 import re
@@ -155,7 +156,8 @@ def normalize_numeric_columns(
         # Auto-detect numeric columns by trying to parse first non-null value
         numeric_columns = []
         for col in df.columns:
-            first_val = df[col].dropna().iloc[0] if not df[col].dropna().empty else None
+            non_null = df[col].dropna()
+            first_val = non_null.iloc[0] if not non_null.empty else None
             if first_val is not None and isinstance(first_val, str):
                 try:
                     parse_locale_number(first_val, decimal_sep)
@@ -163,7 +165,18 @@ def normalize_numeric_columns(
                 except (ValueError, AttributeError):
                     pass
     
+    # Same rules as parse_locale_number, applied with the str accessor
+    thousand_sep = "," if decimal_sep == "." else "."
     for col in numeric_columns:
-        df[col] = df[col].apply(lambda x: parse_locale_number(x, decimal_sep) if pd.notna(x) else np.nan)
+        values = df[col]
+        values = values.where(values.notna(), np.nan)
+        if infer_dtype(values, skipna=True) in ("string", "mixed", "mixed-integer"):
+            # Non-string cells come back as NaN from .str and are kept as is
+            strings = values.str.replace(thousand_sep, "", regex=False)
+            is_string = strings.notna()
+            if decimal_sep != "." and is_string.any():
+                strings = strings.str.replace(decimal_sep, ".", regex=False)
+            values = strings.where(is_string, values)
+        df[col] = values.astype(float)
     
     return df
\ No newline at end of file
@@ -2,9 +2,10 @@
 """Script to update golden test expected outputs."""
 
 import argparse
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-import shutil
 
 from golden_runner import run_golden_case, discover_cases, load_spec
 
@@ -29,7 +30,7 @@ def update_golden_case(case_dir: str, verbose: bool = False):
     spec = load_spec(case_path / "config.yaml")
     result = run_golden_case(case_dir, spec=spec, save_artifacts=True)
     
-    # Copy artifacts to expected files
+    # Move artifacts over the expected files (same filesystem, so a rename)
     artifacts_dir = case_path / "artifacts"
     
     if artifacts_dir.exists():
@@ -37,12 +38,12 @@ def update_golden_case(case_dir: str, verbose: bool = False):
         actual_report = artifacts_dir / "actual_report.json"
         
         if actual_output.exists():
-            shutil.copy(actual_output, case_path / "expected_output.csv")
+            actual_output.replace(case_path / "expected_output.csv")
             if verbose:
                 print(f"  Updated expected_output.csv")
         
         if actual_report.exists():
-            shutil.copy(actual_report, case_path / "expected_report.json")
+            actual_report.replace(case_path / "expected_report.json")
             if verbose:
                 print(f"  Updated expected_report.json")
         
@@ -72,6 +73,12 @@ def main():
         action="store_true",
         help="Print detailed information"
     )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of cases to update in parallel (default: CPU count)"
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -103,10 +110,16 @@ def main():
             print(f"  Would update: {case}")
         return 0
     
-    success_count = 0
-    for case in cases:
-        if update_golden_case(case, verbose=args.verbose):
-            success_count += 1
+    # Cases write to disjoint directories, so they can run in parallel
+    jobs = max(1, min(args.jobs, len(cases)))
+    if jobs == 1:
+        results = [update_golden_case(case, verbose=args.verbose) for case in cases]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(
+                update_golden_case, cases, [args.verbose] * len(cases)
+            ))
+    success_count = sum(1 for updated in results if updated)
     
     print(f"\nUpdated {success_count}/{len(cases)} test cases successfully")
     
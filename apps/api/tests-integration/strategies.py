@@ -1,76 +1,97 @@
 """
 Estratégias customizadas do Hypothesis para ValidaHub.
 Limitações bem definidas para evitar falsos positivos e flaky tests.
+
+Estratégias são imutáveis, então cada uma é construída uma única vez no
+módulo e as funções apenas devolvem a instância compartilhada.
 """
+from functools import lru_cache
 from hypothesis import strategies as st
 from datetime import datetime, timezone
 import string
 
 # Estratégias para tipos básicos com limites sensatos
+_EMAIL_LOCAL = st.text(
+    alphabet=string.ascii_letters + string.digits + "._-",
+    min_size=1,
+    max_size=64
+)
+# Domínios gerados direto por regex (sem .filter): rótulos separados por
+# ".", sem ponto no início ou no fim, entre 4 e 255 caracteres
+_EMAIL_DOMAIN = st.from_regex(
+    r"[a-z0-9-]{2,63}(?:\.[a-z0-9-]{1,63}){1,3}",
+    fullmatch=True
+)
+_VALID_EMAIL = st.builds(lambda l, d: f"{l}@{d}", _EMAIL_LOCAL, _EMAIL_DOMAIN)
+
 def valid_email():
     """Email válido com limites razoáveis."""
-    local = st.text(
-        alphabet=string.ascii_letters + string.digits + "._-",
-        min_size=1,
-        max_size=64
-    )
-    domain = st.text(
-        alphabet=string.ascii_lowercase + string.digits + ".-",
-        min_size=4,
-        max_size=255
-    ).filter(lambda x: "." in x and not x.startswith(".") and not x.endswith("."))
-    
-    return st.builds(lambda l, d: f"{l}@{d}", local, domain)
+    return _VALID_EMAIL
+
+_URL_PROTOCOL = st.sampled_from(["http", "https"])
+_URL_DOMAIN = st.from_regex(
+    r"[a-z0-9-]{2,40}(?:\.[a-z0-9-]{1,20}){1,2}",
+    fullmatch=True
+)
+_URL_PATH = st.text(
+    alphabet=string.ascii_letters + string.digits + "/-_",
+    max_size=200
+)
+_VALID_URL = st.builds(
+    lambda p, d, pt: f"{p}://{d}/{pt}", _URL_PROTOCOL, _URL_DOMAIN, _URL_PATH
+)
 
 def valid_url():
     """URL válida com protocolo HTTP/HTTPS."""
-    protocol = st.sampled_from(["http", "https"])
-    domain = st.text(
-        alphabet=string.ascii_lowercase + string.digits + ".-",
-        min_size=4,
-        max_size=100
-    ).filter(lambda x: "." in x and not x.startswith(".") and not x.endswith("."))
-    path = st.text(
-        alphabet=string.ascii_letters + string.digits + "/-_",
-        max_size=200
-    )
-    
-    return st.builds(lambda p, d, pt: f"{p}://{d}/{pt}", protocol, domain, path)
+    return _VALID_URL
+
+_MARKETPLACE_ID = st.sampled_from([
+    "MLB", "MLA", "MLM", "MLC", "MLU", "MCO", "MPE", "MLV"
+])
 
 def marketplace_id():
     """IDs de marketplace válidos do MELI."""
-    return st.sampled_from([
-        "MLB", "MLA", "MLM", "MLC", "MLU", "MCO", "MPE", "MLV"
-    ])
+    return _MARKETPLACE_ID
+
+_CURRENCY_CODE = st.sampled_from([
+    "BRL", "ARS", "MXN", "CLP", "UYU", "COP", "PEN", "VES", "USD"
+])
 
 def currency_code():
     """Códigos de moeda válidos."""
-    return st.sampled_from([
-        "BRL", "ARS", "MXN", "CLP", "UYU", "COP", "PEN", "VES", "USD"
-    ])
+    return _CURRENCY_CODE
+
+_PRICE_AMOUNT = st.decimals(
+    min_value=0.01,
+    max_value=1000000.00,
+    places=2
+)
 
 def price_amount():
     """Valores de preço realistas (0.01 a 1000000.00)."""
-    return st.decimals(
-        min_value=0.01,
-        max_value=1000000.00,
-        places=2
-    )
+    return _PRICE_AMOUNT
+
+_PRODUCT_ID = st.builds(
+    lambda p, n: f"{p}{n}",
+    _MARKETPLACE_ID,
+    st.integers(min_value=100000000, max_value=999999999)
+)
 
 def product_id():
     """IDs de produto no formato MELI."""
-    prefix = marketplace_id()
-    numbers = st.integers(min_value=100000000, max_value=999999999)
-    return st.builds(lambda p, n: f"{p}{n}", prefix, numbers)
+    return _PRODUCT_ID
+
+_DATETIME_UTC = st.datetimes(
+    min_value=datetime(2020, 1, 1, tzinfo=timezone.utc),
+    max_value=datetime(2030, 12, 31, tzinfo=timezone.utc),
+    timezones=st.just(timezone.utc)
+)
 
 def datetime_utc():
     """Datetime com timezone UTC."""
-    return st.datetimes(
-        min_value=datetime(2020, 1, 1, tzinfo=timezone.utc),
-        max_value=datetime(2030, 12, 31, tzinfo=timezone.utc),
-        timezones=st.just(timezone.utc)
-    )
+    return _DATETIME_UTC
 
+@lru_cache(maxsize=None)
 def safe_string(min_size=0, max_size=100):
     """String segura sem caracteres problemáticos."""
     return st.text(
@@ -79,36 +100,48 @@ def safe_string(min_size=0, max_size=100):
         max_size=max_size
     ).filter(lambda x: x.strip() if min_size > 0 else True)
 
+_BATCH_SIZE = st.integers(min_value=1, max_value=100)
+
 def batch_size():
     """Tamanhos de batch realistas."""
-    return st.integers(min_value=1, max_value=100)
+    return _BATCH_SIZE
+
+_RETRY_COUNT = st.integers(min_value=0, max_value=10)
 
 def retry_count():
     """Número de retries sensato."""
-    return st.integers(min_value=0, max_value=10)
+    return _RETRY_COUNT
+
+_TIMEOUT_SECONDS = st.integers(min_value=1, max_value=300)
 
 def timeout_seconds():
     """Timeouts em segundos (1s a 5min)."""
-    return st.integers(min_value=1, max_value=300)
+    return _TIMEOUT_SECONDS
+
+_PORT_NUMBER = st.integers(min_value=1024, max_value=65535)
 
 def port_number():
     """Números de porta válidos."""
-    return st.integers(min_value=1024, max_value=65535)
+    return _PORT_NUMBER
+
+_PERCENTAGE = st.floats(min_value=0.0, max_value=100.0)
 
 def percentage():
     """Porcentagem (0 a 100)."""
-    return st.floats(min_value=0.0, max_value=100.0)
+    return _PERCENTAGE
+
+_JSON_SAFE_DICT = st.dictionaries(
+    keys=safe_string(min_size=1, max_size=50),
+    values=st.one_of(
+        st.none(),
+        st.booleans(),
+        st.integers(min_value=-1000000, max_value=1000000),
+        st.floats(min_value=-1000000.0, max_value=1000000.0, allow_nan=False, allow_infinity=False),
+        safe_string(max_size=1000)
+    ),
+    max_size=20
+)
 
 def json_safe_dict():
     """Dicionário que pode ser serializado em JSON."""
-    return st.dictionaries(
-        keys=safe_string(min_size=1, max_size=50),
-        values=st.one_of(
-            st.none(),
-            st.booleans(),
-            st.integers(min_value=-1000000, max_value=1000000),
-            st.floats(min_value=-1000000.0, max_value=1000000.0, allow_nan=False, allow_infinity=False),
-            safe_string(max_size=1000)
-        ),
-        max_size=20
-    )
\ No newline at end of file
+    return _JSON_SAFE_DICT
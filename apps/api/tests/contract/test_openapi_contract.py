@@ -6,35 +6,65 @@ import pytest
 from pathlib import Path
 import yaml
 import json
-from openapi_spec_validator import validate_spec
-from jsonschema import validate, ValidationError
-import httpx
-from typing import Dict, Any
+from jsonschema import ValidationError
+from jsonschema.validators import validator_for
+from functools import lru_cache
+from typing import Dict, Any, Optional
+
+# libyaml-backed loader when available, pure-Python SafeLoader otherwise
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# orjson parses a JSON spec in C when installed; stdlib json otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+SPEC_PATHS = (
+    Path("openapi.yaml"),
+    Path("openapi.yml"),
+    Path("openapi.json"),
+    Path("docs/openapi.yaml"),
+    Path("docs/api.yaml"),
+)
+
+
+def _compile_schema(schema: Dict[str, Any]):
+    """Check a JSON Schema once and return a reusable validator for it."""
+    validator_cls = validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
+@lru_cache(maxsize=None)
+def _find_spec_path() -> Optional[Path]:
+    """First existing OpenAPI spec file, resolved once per session."""
+    for path in SPEC_PATHS:
+        if path.exists():
+            return path
+    return None
 
 
 class TestOpenAPIContract:
     """Test API compliance with OpenAPI specification."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def openapi_spec(self):
-        """Load OpenAPI specification."""
+        """Load OpenAPI specification (parsed once per session, read-only)."""
         # First check if we have an OpenAPI spec file
-        spec_paths = [
-            Path("openapi.yaml"),
-            Path("openapi.yml"),
-            Path("openapi.json"),
-            Path("docs/openapi.yaml"),
-            Path("docs/api.yaml"),
-        ]
-        
-        for path in spec_paths:
-            if path.exists():
-                if path.suffix in ['.yaml', '.yml']:
-                    with open(path) as f:
-                        return yaml.safe_load(f)
-                else:
-                    with open(path) as f:
-                        return json.load(f)
+        path = _find_spec_path()
+        if path is not None:
+            if path.suffix in ['.yaml', '.yml']:
+                with open(path) as f:
+                    return yaml.load(f, Loader=_YamlLoader)
+            elif orjson is not None:
+                return orjson.loads(path.read_bytes())
+            else:
+                with open(path) as f:
+                    return json.load(f)
         
         # If no spec file exists, create a minimal one for testing
         return {
@@ -131,17 +161,27 @@ class TestOpenAPIContract:
             }
         }
     
+    @pytest.fixture(scope="session")
+    def health_validator(self, openapi_spec):
+        """Validator for the health response schema, built once per session."""
+        health_schema = openapi_spec["paths"]["/health"]["get"]["responses"]["200"]
+        return _compile_schema(health_schema["content"]["application/json"]["schema"])
+    
+    @pytest.fixture(scope="session")
+    def validation_result_validator(self, openapi_spec):
+        """Validator for the ValidationResult schema, built once per session."""
+        return _compile_schema(openapi_spec["components"]["schemas"]["ValidationResult"])
+    
     def test_openapi_spec_is_valid(self, openapi_spec):
         """Test that OpenAPI specification is valid."""
+        # Imported here so collecting the other contract tests skips it
+        from openapi_spec_validator import validate_spec
+
         # This will raise an exception if the spec is invalid
         validate_spec(openapi_spec)
     
-    def test_health_endpoint_contract(self, openapi_spec):
+    def test_health_endpoint_contract(self, health_validator):
         """Test health endpoint matches contract."""
-        # Get health endpoint schema from spec
-        health_schema = openapi_spec["paths"]["/health"]["get"]["responses"]["200"]
-        expected_schema = health_schema["content"]["application/json"]["schema"]
-        
         # Mock response that should match the schema
         mock_response = {
             "status": "healthy",
@@ -150,7 +190,7 @@ class TestOpenAPIContract:
         
         # Validate response against schema
         try:
-            validate(instance=mock_response, schema=expected_schema)
+            health_validator.validate(mock_response)
         except ValidationError as e:
             pytest.fail(f"Response does not match schema: {e}")
     
@@ -169,11 +209,8 @@ class TestOpenAPIContract:
         assert "MERCADO_LIVRE" in marketplace_enum
         assert "AMAZON" in marketplace_enum
     
-    def test_validation_response_schema(self, openapi_spec):
+    def test_validation_response_schema(self, validation_result_validator):
         """Test validation endpoint response schema."""
-        # Get ValidationResult schema
-        validation_schema = openapi_spec["components"]["schemas"]["ValidationResult"]
-        
         # Mock response that should match the schema
         mock_response = {
             "total_rows": 100,
@@ -190,7 +227,7 @@ class TestOpenAPIContract:
         
         # Validate response against schema
         try:
-            validate(instance=mock_response, schema=validation_schema)
+            validation_result_validator.validate(mock_response)
         except ValidationError as e:
             pytest.fail(f"Response does not match schema: {e}")
     
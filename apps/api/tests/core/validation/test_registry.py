@@ -2,18 +2,21 @@
 Tests for the validation registry system.
 """
 
+import re
 import pytest
 from datetime import datetime, date
 from core.validation.registry import ValidationRegistry, ValidatorSpec
 from core.validation.validators_builtin import register_builtin_validators
 from adapters.acl_meli.models.canonical_rule import DataType
 
+_EMAIL_RE = re.compile(r'^[\w\.-]+@[\w\.-]+\.\w+$')
+
 
 @pytest.fixture
 def registry():
-    """Create a fresh registry for each test."""
+    """Create a fresh registry with the built-in validators for each test."""
     reg = ValidationRegistry()
-    register_builtin_validators(DataType)
+    register_builtin_validators(DataType, reg)
     return reg
 
 
@@ -94,40 +97,52 @@ class TestValidationRegistry:
 class TestBuiltinValidators:
     """Test the built-in type validators."""
     
-    def test_string_validation(self, registry):
+    @pytest.mark.parametrize("value,expected", [
+        ("hello", True),
+        ("", True),
+        (123, False),
+        (None, False),
+    ])
+    def test_string_validation(self, registry, value, expected):
         """Test string type validation."""
-        assert registry.validate(DataType.STRING, "hello")
-        assert registry.validate(DataType.STRING, "")
-        assert not registry.validate(DataType.STRING, 123)
-        assert not registry.validate(DataType.STRING, None)
-    
-    def test_integer_without_bool(self, registry):
+        assert registry.validate(DataType.STRING, value) is expected
+    
+    @pytest.mark.parametrize("value,expected", [
+        (42, True),
+        (0, True),
+        (-1, True),
+        (True, False),
+        (False, False),
+        (3.14, False),
+        ("42", False),
+    ])
+    def test_integer_without_bool(self, registry, value, expected):
         """Test that integers don't accept booleans."""
-        assert registry.validate(DataType.INTEGER, 42)
-        assert registry.validate(DataType.INTEGER, 0)
-        assert registry.validate(DataType.INTEGER, -1)
-        assert not registry.validate(DataType.INTEGER, True)
-        assert not registry.validate(DataType.INTEGER, False)
-        assert not registry.validate(DataType.INTEGER, 3.14)
-        assert not registry.validate(DataType.INTEGER, "42")
-    
-    def test_float_accepts_int_not_bool(self, registry):
+        assert registry.validate(DataType.INTEGER, value) is expected
+    
+    @pytest.mark.parametrize("value,expected", [
+        (3.14, True),
+        (0.0, True),
+        (42, True),  # int is ok
+        (-1, True),
+        (True, False),
+        (False, False),
+        ("3.14", False),
+    ])
+    def test_float_accepts_int_not_bool(self, registry, value, expected):
         """Test that float accepts int but not bool."""
-        assert registry.validate(DataType.FLOAT, 3.14)
-        assert registry.validate(DataType.FLOAT, 0.0)
-        assert registry.validate(DataType.FLOAT, 42)  # int is ok
-        assert registry.validate(DataType.FLOAT, -1)
-        assert not registry.validate(DataType.FLOAT, True)
-        assert not registry.validate(DataType.FLOAT, False)
-        assert not registry.validate(DataType.FLOAT, "3.14")
-    
-    def test_boolean_validation(self, registry):
+        assert registry.validate(DataType.FLOAT, value) is expected
+    
+    @pytest.mark.parametrize("value,expected", [
+        (True, True),
+        (False, True),
+        (1, False),
+        (0, False),
+        ("true", False),
+    ])
+    def test_boolean_validation(self, registry, value, expected):
         """Test boolean type validation."""
-        assert registry.validate(DataType.BOOLEAN, True)
-        assert registry.validate(DataType.BOOLEAN, False)
-        assert not registry.validate(DataType.BOOLEAN, 1)
-        assert not registry.validate(DataType.BOOLEAN, 0)
-        assert not registry.validate(DataType.BOOLEAN, "true")
+        assert registry.validate(DataType.BOOLEAN, value) is expected
     
     def test_date_datetime_validation(self, registry):
         """Test date and datetime validation."""
@@ -145,20 +160,26 @@ class TestBuiltinValidators:
         assert registry.validate(DataType.DATETIME, now)
         assert not registry.validate(DataType.DATETIME, 123)
     
-    def test_array_validation(self, registry):
+    @pytest.mark.parametrize("value,expected", [
+        ([1, 2, 3], True),
+        ([], True),
+        ((1, 2, 3), True),
+        ("not an array", False),
+        ({"key": "value"}, False),
+    ])
+    def test_array_validation(self, registry, value, expected):
         """Test array type validation."""
-        assert registry.validate(DataType.ARRAY, [1, 2, 3])
-        assert registry.validate(DataType.ARRAY, [])
-        assert registry.validate(DataType.ARRAY, (1, 2, 3))
-        assert not registry.validate(DataType.ARRAY, "not an array")
-        assert not registry.validate(DataType.ARRAY, {"key": "value"})
-    
-    def test_object_validation(self, registry):
+        assert registry.validate(DataType.ARRAY, value) is expected
+    
+    @pytest.mark.parametrize("value,expected", [
+        ({"key": "value"}, True),
+        ({}, True),
+        ([1, 2, 3], False),
+        ("not an object", False),
+    ])
+    def test_object_validation(self, registry, value, expected):
         """Test object (dict) type validation."""
-        assert registry.validate(DataType.OBJECT, {"key": "value"})
-        assert registry.validate(DataType.OBJECT, {})
-        assert not registry.validate(DataType.OBJECT, [1, 2, 3])
-        assert not registry.validate(DataType.OBJECT, "not an object")
+        assert registry.validate(DataType.OBJECT, value) is expected
     
     def test_unknown_type_is_permissive(self, registry):
         """Test that unknown types are permissive by default."""
@@ -177,15 +198,12 @@ class TestExtensibility:
     def test_custom_validator(self, registry):
         """Test adding custom validators."""
         # Add a custom email validator
-        import re
-        email_pattern = re.compile(r'^[\w\.-]+@[\w\.-]+\.\w+$')
-        
         class CustomType:
             EMAIL = "email"
         
         registry.register(
             CustomType.EMAIL,
-            lambda v: isinstance(v, str) and email_pattern.match(v) is not None,
+            lambda v: isinstance(v, str) and _EMAIL_RE.match(v) is not None,
             meta=ValidatorSpec(name="email", description="Validates email addresses")
         )
         
@@ -202,7 +220,7 @@ class TestExtensibility:
         # MELI IDs are strings starting with "MLB"
         registry.register(
             MeliTypes.MELI_ID,
-            lambda v: isinstance(v, str) and v.startswith("MLB"),
+            lambda v: type(v) is str and v.startswith("MLB"),
             meta=ValidatorSpec(name="meli_id", description="MELI product ID")
         )
         
@@ -27,15 +27,14 @@ SKU003,Product 3,not_a_price,10,Electronics
 def generate_large_csv_sample(rows: int = 1000) -> str:
     """Generate a large CSV sample for performance testing."""
     header = "sku,title,price,stock,category"
+    categories = ("Electronics", "Clothing", "Home", "Sports")
+    # price, stock and category repeat every 100 rows; format them once
+    tails = [f"{10.0 + j:.2f},{j % 50},{categories[j % 4]}" for j in range(100)]
     lines = [header]
-    
-    for i in range(rows):
-        sku = f"SKU{i:05d}"
-        title = f"Product {i}"
-        price = f"{10.0 + (i % 100):.2f}"
-        stock = i % 50
-        category = ["Electronics", "Clothing", "Home", "Sports"][i % 4]
-        lines.append(f"{sku},{title},{price},{stock},{category}")
+    lines.extend(
+        f"SKU{i:05d},Product {i},{tails[i % 100]}"
+        for i in range(rows)
+    )
     
     return "\n".join(lines)
 
@@ -48,4 +47,4 @@ MLB003,Cafeteira Expresso,150.00,0,Eletrodomésticos,Nespresso,used"""
 AMAZON_SAMPLE = """sku,title,price,stock,category,asin,fulfillment
 AMZ001,Echo Dot (4th Gen),49.99,100,Smart Home,B07XJ8C8F5,FBA
 AMZ002,Fire TV Stick 4K,39.99,50,Electronics,B08XVYZ1Y5,FBA
-AMZ003,Kindle Paperwhite,129.99,25,E-readers,B08KTZ8249,FBM"""
\ No newline at end of file
+AMZ003,Kindle Paperwhite,129.99,25,E-readers,B08KTZ8249,FBM"""
@@ -2,49 +2,66 @@
 Integration tests for CSV validation with real data and policies.
 """
 
+import logging
+import re
 import pytest
 import pandas as pd
 from pathlib import Path
-import sys
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+from collections import Counter
 
 from services.policy_loader import PolicyLoader
 from services.policy_rule_engine import PolicyRuleEngine
 
+logger = logging.getLogger(__name__)
+
+_ROW2_CODE_RE = re.compile(r"FORBIDDEN|INVALID|TOO_LONG")
+
 
 class TestRealCSVValidation:
     """Test CSV validation with real fixtures and policies."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def policy_loader(self):
-        """Create policy loader with real policies."""
+        """Create policy loader with real policies (read-only, shared per session)."""
         return PolicyLoader()
     
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def rule_engine(self, policy_loader):
         """Create rule engine with policy loader."""
         return PolicyRuleEngine(policy_loader)
     
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def fixtures_dir(self):
         """Get fixtures directory."""
         return Path(__file__).parent.parent / "fixtures" / "csv"
     
-    def test_validate_valid_csv(self, rule_engine, fixtures_dir):
+    @pytest.fixture(scope="session")
+    def valid_csv_df(self, fixtures_dir):
+        """Valid CSV fixture, parsed once per session (read-only)."""
+        return pd.read_csv(fixtures_dir / "valid" / "celulares_ml_valid.csv")
+    
+    @pytest.fixture(scope="session")
+    def invalid_csv_df(self, fixtures_dir):
+        """Invalid CSV fixture, parsed once per session (read-only)."""
+        return pd.read_csv(fixtures_dir / "invalid" / "celulares_ml_invalid.csv")
+    
+    @pytest.fixture(scope="session")
+    def edge_csv_df(self, fixtures_dir):
+        """Edge-case CSV fixture, parsed once per session (read-only)."""
+        return pd.read_csv(fixtures_dir / "edge-cases" / "celulares_ml_edge.csv")
+    
+    def test_validate_valid_csv(self, rule_engine, valid_csv_df):
         """Test validation of valid CSV file."""
-        # Load valid CSV
-        csv_path = fixtures_dir / "valid" / "celulares_ml_valid.csv"
-        df = pd.read_csv(csv_path)
+        df = valid_csv_df
         
         all_valid = True
         all_errors = []
         
         # Validate each row
-        for idx, row in df.iterrows():
+        # Plain dicts; iterrows() would build a Series per row
+        for idx, row in enumerate(df.to_dict(orient="records")):
             is_valid, errors, corrections = rule_engine.validate_row(
-                row.to_dict(),
+                row,
                 marketplace="MLB",
                 category="MLB1743",
                 row_number=idx + 1
@@ -59,29 +76,27 @@ class TestRealCSVValidation:
                         "errors": error_details
                     })
         
-        # Print errors for debugging
-        if all_errors:
-            print("\nValidation errors found in 'valid' CSV:")
-            for row_errors in all_errors:
-                print(f"  Row {row_errors['row']}:")
-                for error in row_errors['errors']:
-                    print(f"    - {error['field']}: {error['message']}")
+        # Log errors for debugging (shown with --log-cli-level=DEBUG)
+        for row_errors in all_errors:
+            for error in row_errors['errors']:
+                logger.debug(
+                    "Row %s of 'valid' CSV: %s: %s",
+                    row_errors['row'], error['field'], error['message']
+                )
         
         # Most rows should be valid (allow some warnings)
         assert len(all_errors) <= 1, f"Too many errors in valid CSV: {len(all_errors)}"
     
-    def test_validate_invalid_csv(self, rule_engine, fixtures_dir):
+    def test_validate_invalid_csv(self, rule_engine, invalid_csv_df):
         """Test validation of invalid CSV file."""
-        # Load invalid CSV
-        csv_path = fixtures_dir / "invalid" / "celulares_ml_invalid.csv"
-        df = pd.read_csv(csv_path)
+        df = invalid_csv_df
         
         errors_by_row = {}
         
         # Validate each row
-        for idx, row in df.iterrows():
+        for idx, row in enumerate(df.to_dict(orient="records")):
             is_valid, errors, corrections = rule_engine.validate_row(
-                row.to_dict(),
+                row,
                 marketplace="MLB",
                 category="MLB1743",
                 row_number=idx + 1
@@ -98,7 +113,7 @@ class TestRealCSVValidation:
         # Check specific expected errors
         # Row 1: Missing SKU, title too short, price = 0
         row_1_errors = errors_by_row.get(1, [])
-        error_fields = [e['field'] for e in row_1_errors]
+        error_fields = {e['field'] for e in row_1_errors}
         assert 'sku' in error_fields or 'SKU' in error_fields
         assert 'title' in error_fields
         assert 'price' in error_fields
@@ -106,31 +121,30 @@ class TestRealCSVValidation:
         # Row 2: Invalid SKU characters, title too long with forbidden chars
         row_2_errors = errors_by_row.get(2, [])
         error_codes = [e['code'] for e in row_2_errors]
-        assert any('FORBIDDEN' in code or 'INVALID' in code or 'TOO_LONG' in code for code in error_codes)
+        assert any(_ROW2_CODE_RE.search(code) for code in error_codes)
     
-    def test_validate_edge_cases(self, rule_engine, fixtures_dir):
+    def test_validate_edge_cases(self, rule_engine, edge_csv_df):
         """Test validation of edge case CSV file."""
-        # Load edge cases CSV
-        csv_path = fixtures_dir / "edge-cases" / "celulares_ml_edge.csv"
-        df = pd.read_csv(csv_path)
+        df = edge_csv_df
         
         results = []
         
         # Validate each row
-        for idx, row in df.iterrows():
+        for idx, row in enumerate(df.to_dict(orient="records")):
             is_valid, errors, corrections = rule_engine.validate_row(
-                row.to_dict(),
+                row,
                 marketplace="MLB",
                 category="MLB1743",
                 row_number=idx + 1
             )
             
+            severities = Counter(e.severity for e in errors)
             results.append({
                 "row": idx + 1,
                 "sku": row.get("sku"),
                 "is_valid": is_valid,
-                "error_count": len([e for e in errors if e.severity == "ERROR"]),
-                "warning_count": len([e for e in errors if e.severity == "WARNING"]),
+                "error_count": severities["ERROR"],
+                "warning_count": severities["WARNING"],
                 "corrections": len(corrections)
             })
         
@@ -203,7 +217,7 @@ class TestRealCSVValidation:
         assert not is_valid, "Row with invalid custom attributes should fail"
         
         # Check for specific custom attribute errors
-        error_fields = [e.field for e in errors if e.severity == "ERROR"]
+        error_fields = {e.field for e in errors if e.severity == "ERROR"}
         assert "STORAGE_CAPACITY" in error_fields or "storage_capacity" in error_fields
         assert "COLOR" in error_fields or "color" in error_fields
     
@@ -2,40 +2,43 @@
 Isolated tests for policy-based CSV validation.
 """
 
+import logging
 import pytest
-import pandas as pd
 from pathlib import Path
 import sys
 import os
+from collections import Counter
+from functools import lru_cache
 
 # Set environment to avoid SQLAlchemy issues
 os.environ["TESTING"] = "true"
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _get_engine():
+    """Rule engine shared by all tests; policies are read-only, so load them once."""
+    from services.policy_rule_engine import PolicyRuleEngine
+
+    return PolicyRuleEngine()
 
 
 def test_policy_loader_basic():
     """Test basic policy loading."""
-    from services.policy_loader import PolicyLoader
-    
-    loader = PolicyLoader()
+    loader = _get_engine().policy_loader
     policy = loader.get_policy("MLB", "MLB1743")
     
     assert policy is not None
     assert policy["marketplace"] == "MLB"
     assert policy["category_id"] == "MLB1743"
     assert "rules" in policy
-    print(f"✓ Loaded policy: {policy['category_name']}")
+    logger.debug("Loaded policy: %s", policy['category_name'])
 
 
 def test_validate_valid_row():
     """Test validating a valid product row."""
-    from services.policy_loader import PolicyLoader
-    from services.policy_rule_engine import PolicyRuleEngine
-    
-    loader = PolicyLoader()
-    engine = PolicyRuleEngine(loader)
+    engine = _get_engine()
     
     # Valid row
     row = {
@@ -61,16 +64,12 @@ def test_validate_valid_row():
     actual_errors = [e for e in errors if e.severity == "ERROR"]
     
     assert is_valid or len(actual_errors) == 0, f"Valid row should pass: {[e.to_dict() for e in actual_errors]}"
-    print(f"✓ Valid row passed with {len(errors)} warnings")
+    logger.debug("Valid row passed with %d warnings", len(errors))
 
 
 def test_validate_invalid_row():
     """Test validating an invalid product row."""
-    from services.policy_loader import PolicyLoader
-    from services.policy_rule_engine import PolicyRuleEngine
-    
-    loader = PolicyLoader()
-    engine = PolicyRuleEngine(loader)
+    engine = _get_engine()
     
     # Invalid row
     row = {
@@ -98,21 +97,19 @@ def test_validate_invalid_row():
     assert len(actual_errors) >= 5, f"Should have multiple errors, got {len(actual_errors)}"
     
     # Check specific error types
-    error_fields = [e.field for e in actual_errors]
+    error_fields = {e.field for e in actual_errors}
     assert "sku" in error_fields or "SKU" in error_fields
     assert "title" in error_fields
     assert "price" in error_fields
     
-    print(f"✓ Invalid row detected {len(actual_errors)} errors")
+    logger.debug("Invalid row detected %d errors", len(actual_errors))
 
 
 def test_validate_real_csv():
     """Test validating a real CSV file."""
-    from services.policy_loader import PolicyLoader
-    from services.policy_rule_engine import PolicyRuleEngine
-    
-    loader = PolicyLoader()
-    engine = PolicyRuleEngine(loader)
+    import pandas as pd
+
+    engine = _get_engine()
     
     # Load CSV
     csv_path = Path(__file__).parent.parent / "fixtures" / "csv" / "valid" / "celulares_ml_valid.csv"
@@ -122,20 +119,21 @@ def test_validate_real_csv():
     df = pd.read_csv(csv_path)
     
     results = []
-    for idx, row in df.iterrows():
+    # Plain dicts; iterrows() would build a Series per row
+    for idx, row in enumerate(df.to_dict(orient="records")):
         is_valid, errors, corrections = engine.validate_row(
-            row.to_dict(),
+            row,
             marketplace="MLB",
             category="MLB1743",
             row_number=idx + 1
         )
         
-        actual_errors = [e for e in errors if e.severity == "ERROR"]
+        severities = Counter(e.severity for e in errors)
         results.append({
             "row": idx + 1,
-            "valid": is_valid or len(actual_errors) == 0,
-            "errors": len(actual_errors),
-            "warnings": len([e for e in errors if e.severity == "WARNING"])
+            "valid": is_valid or severities["ERROR"] == 0,
+            "errors": severities["ERROR"],
+            "warnings": severities["WARNING"]
         })
     
     # Summary
@@ -143,11 +141,10 @@ def test_validate_real_csv():
     total_errors = sum(r["errors"] for r in results)
     total_warnings = sum(r["warnings"] for r in results)
     
-    print(f"\n📊 CSV Validation Summary:")
-    print(f"  Total rows: {len(results)}")
-    print(f"  Valid rows: {valid_count}/{len(results)}")
-    print(f"  Total errors: {total_errors}")
-    print(f"  Total warnings: {total_warnings}")
+    logger.debug(
+        "CSV validation summary: %d/%d valid rows, %d errors, %d warnings",
+        valid_count, len(results), total_errors, total_warnings
+    )
     
     # Most rows should be valid
     assert valid_count >= len(results) - 1, f"Most rows should be valid, got {valid_count}/{len(results)}"
@@ -155,11 +152,7 @@ def test_validate_real_csv():
 
 def test_corrections_suggested():
     """Test that corrections are suggested for fixable issues."""
-    from services.policy_loader import PolicyLoader
-    from services.policy_rule_engine import PolicyRuleEngine
-    
-    loader = PolicyLoader()
-    engine = PolicyRuleEngine(loader)
+    engine = _get_engine()
     
     # Row with fixable issues
     row = {
@@ -181,18 +174,18 @@ def test_corrections_suggested():
         row_number=1
     )
     
-    print(f"✓ Detected {len(corrections)} corrections")
+    logger.debug("Detected %d corrections", len(corrections))
     for correction in corrections:
-        print(f"  - {correction['field']}: '{correction['original']}' → '{correction['corrected']}' ({correction['reason']})")
+        logger.debug(
+            "%s: %r -> %r (%s)",
+            correction['field'], correction['original'],
+            correction['corrected'], correction['reason']
+        )
 
 
 def test_edge_cases():
     """Test edge cases and boundary values."""
-    from services.policy_loader import PolicyLoader
-    from services.policy_rule_engine import PolicyRuleEngine
-    
-    loader = PolicyLoader()
-    engine = PolicyRuleEngine(loader)
+    engine = _get_engine()
     
     test_cases = [
         {
@@ -229,15 +222,23 @@ def test_edge_cases():
         actual_valid = is_valid or len(actual_errors) == 0
         
         if actual_valid != test_case["should_be_valid"]:
-            print(f"❌ {test_case['name']}: Expected valid={test_case['should_be_valid']}, got {actual_valid}")
-            if actual_errors:
-                for e in actual_errors:
-                    print(f"   Error: {e.field} - {e.message}")
+            logger.debug(
+                "%s: expected valid=%s, got %s",
+                test_case['name'], test_case['should_be_valid'], actual_valid
+            )
+            for e in actual_errors:
+                logger.debug("  %s - %s", e.field, e.message)
         else:
-            print(f"✓ {test_case['name']}: Passed")
+            logger.debug("%s: passed", test_case['name'])
 
 
 if __name__ == "__main__":
+    logging.basicConfig(format="%(message)s")
+    logger.setLevel(logging.DEBUG)
+    
+    # pytest gets src from the pythonpath setting; direct runs need it here
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+    
     print("🧪 Running Policy Validation Tests\n")
     
     test_policy_loader_basic()
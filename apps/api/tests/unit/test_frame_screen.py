@@ -0,0 +1,71 @@
+"""Tests for vectorized rule screening."""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from src.libs.rule_engine.engine import RuleEngine
+from src.infrastructure.validators.frame_screen import screen_clean_rows
+
+
+def _engine(rules, mappings=None):
+    engine = RuleEngine()
+    engine.rules = rules
+    engine.mappings = mappings or {}
+    return engine
+
+
+def _row_engine_clean(engine, df):
+    """Reference: a row is clean when the row engine reports only PASS/SKIP."""
+    return [
+        all(r.status in ("PASS", "SKIP") for r in engine.execute(row))
+        for row in df.to_dict("records")
+    ]
+
+
+class TestScreenCleanRows:
+    """Test that screening never hides a row-engine failure."""
+
+    def test_required_numeric_and_set_checks(self):
+        engine = _engine(
+            [
+                {"id": "sku_required", "check": {"type": "required", "field": "sku"}},
+                {"id": "price_min", "when": "price", "check": {"type": "numeric_min", "field": "price", "value": 0.01}},
+                {"id": "condition_valid", "check": {"type": "in_set", "field": "condition", "mapping": "conditions"}},
+            ],
+            {"conditions": {"new": "new", "used": "used"}},
+        )
+        df = pd.DataFrame({
+            "sku": ["A", "", "C", None, "E"],
+            "price": ["10", "5", "-1", "3", "abc"],
+            "condition": ["new", "used", "new", "new", "old"],
+        })
+
+        clean = screen_clean_rows(engine, df)
+
+        assert list(clean) == [True, False, False, False, False]
+        assert all(ref for ref, c in zip(_row_engine_clean(engine, df), clean) if c)
+
+    def test_missing_column_is_not_clean(self):
+        engine = _engine([{"id": "sku_required", "check": {"type": "required", "field": "sku"}}])
+        df = pd.DataFrame({"title": ["x", "y"]})
+
+        assert not screen_clean_rows(engine, df).any()
+
+    def test_when_condition_skips_rule(self):
+        engine = _engine([
+            {"id": "price_min", "when": "price", "check": {"type": "numeric_min", "field": "price", "value": 1}},
+        ])
+        df = pd.DataFrame({"title": ["x"]})
+
+        assert screen_clean_rows(engine, df).all()
+
+    def test_unknown_check_type_falls_back_to_row_engine(self):
+        engine = _engine([{"id": "custom", "check": {"type": "regex", "field": "sku"}}])
+        df = pd.DataFrame({"sku": ["A", "B"]})
+
+        assert not screen_clean_rows(engine, df).any()
@@ -0,0 +1,55 @@
+"""Tests for policy loading and caching."""
+
+import os
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from src.services.policy_loader import PolicyLoader
+
+
+def _write_policy(policies_dir: Path, category: str, version: str) -> Path:
+    policy_file = policies_dir / "MLB" / "categories" / f"{category}.yml"
+    policy_file.parent.mkdir(parents=True, exist_ok=True)
+    policy_file.write_text(
+        f'version: "{version}"\nmarketplace: MLB\ncategory_id: {category}\n'
+        "rules:\n  title:\n    required: true\n"
+    )
+    return policy_file
+
+
+class TestPolicyLoaderCache:
+    """Test the policy LRU cache."""
+
+    def test_cached_policy_is_reused(self, tmp_path):
+        _write_policy(tmp_path, "MLB1", "1")
+        loader = PolicyLoader(tmp_path)
+
+        assert loader.get_policy("MLB", "MLB1") is loader.get_policy("MLB", "MLB1")
+
+    def test_changed_file_is_reloaded(self, tmp_path):
+        policy_file = _write_policy(tmp_path, "MLB1", "1")
+        loader = PolicyLoader(tmp_path)
+        assert loader.get_policy("MLB", "MLB1")["version"] == "1"
+
+        _write_policy(tmp_path, "MLB1", "22")
+        stat = policy_file.stat()
+        os.utime(policy_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert loader.get_policy("MLB", "MLB1")["version"] == "22"
+
+    def test_least_recently_used_policy_is_evicted(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(PolicyLoader, "CACHE_MAX_ENTRIES", 2)
+        for category in ("MLB1", "MLB2", "MLB3"):
+            _write_policy(tmp_path, category, "1")
+        loader = PolicyLoader(tmp_path)
+
+        loader.get_policy("MLB", "MLB1")
+        loader.get_policy("MLB", "MLB2")
+        loader.get_policy("MLB", "MLB1")
+        loader.get_policy("MLB", "MLB3")
+
+        cached = [Path(key).stem for key in loader._cache]
+        assert cached == ["MLB1", "MLB3"]
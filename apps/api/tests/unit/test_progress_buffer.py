@@ -0,0 +1,51 @@
+"""Tests for buffered job progress reporting."""
+
+import sys
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from src.workers.progress import ProgressBuffer
+
+
+class TestProgressBuffer:
+    """Test progress coalescing."""
+
+    def _buffer(self, update_fn, telemetry=None):
+        return ProgressBuffer("task-1", "job-1", "validate_csv_job", {"marketplace": "MLB"}, update_fn, telemetry)
+
+    def test_intermediate_steps_are_coalesced(self):
+        update_fn = Mock()
+        telemetry = Mock()
+
+        with self._buffer(update_fn, telemetry) as progress:
+            for step in (10, 30, 50, 80, 100):
+                progress.update(step, f"step {step}")
+
+        assert [c.args[1] for c in update_fn.call_args_list] == [10, 50, 100]
+        assert [c.kwargs["progress"] for c in telemetry.emit_job_progress.call_args_list] == [10, 50, 100]
+
+    def test_pending_step_flushed_on_exit(self):
+        update_fn = Mock()
+
+        with self._buffer(update_fn) as progress:
+            progress.update(10, "start")
+            progress.update(30, "loaded")
+
+        update_fn.assert_called_with("task-1", 30, "loaded")
+        assert update_fn.call_count == 2
+
+    def test_pending_step_not_flushed_on_error(self):
+        update_fn = Mock()
+
+        with pytest.raises(RuntimeError):
+            with self._buffer(update_fn) as progress:
+                progress.update(10, "start")
+                progress.update(30, "loaded")
+                raise RuntimeError("boom")
+
+        update_fn.assert_called_once_with("task-1", 10, "start")
@@ -0,0 +1,152 @@
+"""Tests for the storage service."""
+
+import io
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from botocore.exceptions import ClientError
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+
+from src.services.storage_service import StorageService
+
+
+class FakeS3Client:
+    """In-memory stand-in for the boto3 S3 client."""
+
+    def __init__(self, fail_put_suffix=None, head_error=None):
+        self.objects = {}
+        self.heads = []
+        self.puts = []
+        self.fail_put_suffix = fail_put_suffix
+        self.head_error = head_error
+
+    def head_object(self, Bucket, Key):
+        self.heads.append(Key)
+        if self.head_error:
+            raise ClientError({"Error": {"Code": self.head_error}}, "HeadObject")
+        if Key not in self.objects:
+            raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+        return {"Metadata": self.objects[Key]["Metadata"]}
+
+    def put_object(self, **kwargs):
+        if self.fail_put_suffix and kwargs["Key"].endswith(self.fail_put_suffix):
+            raise ClientError({"Error": {"Code": "500"}}, "PutObject")
+        self.puts.append(kwargs["Key"])
+        self.objects[kwargs["Key"]] = kwargs
+
+
+def _result(timestamp="2024-01-01T00:00:00"):
+    return {
+        "job_id": "job-1",
+        "timestamp": timestamp,
+        "errors": [{"row": 2, "field": "price", "value": -1.5, "rule": "min_value", "message": "too low"}],
+        "warnings": [{"row": 3, "field": "title", "value": "x", "rule": "min_length", "message": "short"}],
+    }
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    monkeypatch.setenv("TEMP_STORAGE_PATH", str(tmp_path))
+    monkeypatch.setenv("S3_BUCKET", "validahub")
+    monkeypatch.delenv("AWS_ACCESS_KEY_ID", raising=False)
+    monkeypatch.delenv("RESULT_ROWS_FORMAT", raising=False)
+    return StorageService()
+
+
+class TestReadLocalFile:
+    """Test reading uploaded files from local storage."""
+
+    def test_crlf_line_endings_are_normalized(self, storage, tmp_path):
+        upload = tmp_path / "upload.csv"
+        upload.write_bytes(b"sku,title\r\nSKU1,Produto \xc3\xa9\r\nSKU2,Old Mac\rSKU3,x")
+
+        assert storage.download_file(str(upload)) == "sku,title\nSKU1,Produto é\nSKU2,Old Mac\nSKU3,x"
+
+    def test_empty_file_reads_as_empty_string(self, storage, tmp_path):
+        upload = tmp_path / "empty.csv"
+        upload.write_bytes(b"")
+
+        assert storage.download_file(str(upload)) == ""
+
+
+class TestSaveResult:
+    """Test how result rows are stored."""
+
+    def test_json_format_keeps_rows_inline_by_default(self, storage):
+        storage._s3_client = FakeS3Client()
+
+        assert storage.save_result("job-1", _result()) == "s3://validahub/results/job-1.json"
+
+        stored = json.loads(storage._s3_client.objects["results/job-1.json"]["Body"])
+        assert storage._s3_client.puts == ["results/job-1.json"]
+        assert stored["errors"][0]["value"] == -1.5
+        assert stored["warnings"][0]["field"] == "title"
+        assert "rows_ref" not in stored
+
+    def test_parquet_format_moves_rows_to_parquet(self, storage):
+        pq = pytest.importorskip("pyarrow.parquet")
+        storage.result_rows_format = "parquet"
+        storage._s3_client = FakeS3Client()
+
+        storage.save_result("job-1", _result())
+
+        stored = json.loads(storage._s3_client.objects["results/job-1.json"]["Body"])
+        assert stored["rows_ref"] == "s3://validahub/results/job-1.parquet"
+        assert stored["rows_format"] == "parquet"
+        assert "errors" not in stored and "warnings" not in stored
+        rows = pq.read_table(io.BytesIO(storage._s3_client.objects["results/job-1.parquet"]["Body"])).to_pylist()
+        assert [(r["row"], r["value"], r["severity"]) for r in rows] == [(2, "-1.5", "ERROR"), (3, "x", "WARNING")]
+
+    def test_failed_parquet_upload_keeps_rows_inline(self, storage):
+        pytest.importorskip("pyarrow")
+        storage.result_rows_format = "parquet"
+        storage._s3_client = FakeS3Client(fail_put_suffix=".parquet")
+
+        storage.save_result("job-1", _result())
+
+        stored = json.loads(storage._s3_client.objects["results/job-1.json"]["Body"])
+        assert storage._s3_client.puts == ["results/job-1.json"]
+        assert len(stored["errors"]) == 1 and len(stored["warnings"]) == 1
+        assert "rows_ref" not in stored
+
+
+class TestIdempotentUpload:
+    """Test that retried result uploads skip unchanged content."""
+
+    def test_retry_with_new_timestamp_skips_put(self, storage):
+        storage._s3_client = FakeS3Client()
+
+        storage.save_result("job-1", _result("2024-01-01T00:00:00"))
+        storage.save_result("job-1", _result("2024-01-01T00:05:00"))
+
+        assert storage._s3_client.puts == ["results/job-1.json"]
+
+    def test_changed_result_is_uploaded_again(self, storage):
+        storage._s3_client = FakeS3Client()
+        changed = _result()
+        changed["errors"] = []
+
+        storage.save_result("job-1", _result())
+        storage.save_result("job-1", changed)
+
+        assert storage._s3_client.puts == ["results/job-1.json", "results/job-1.json"]
+
+    def test_head_client_error_still_uploads(self, storage):
+        storage._s3_client = FakeS3Client(head_error="403")
+
+        uri = storage.save_result("job-1", _result())
+
+        assert uri == "s3://validahub/results/job-1.json"
+        assert storage._s3_client.puts == ["results/job-1.json"]
+
+    def test_save_file_uploads_without_head(self, storage):
+        storage._s3_client = FakeS3Client()
+
+        storage.save_file("corrected/job-1.csv", b"sku\nSKU1")
+
+        assert storage._s3_client.heads == []
+        assert storage._s3_client.puts == ["corrected/job-1.csv"]